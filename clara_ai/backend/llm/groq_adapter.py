@@ -39,16 +39,24 @@ def call_groq_chat(
     *,
     temperature: float = 0.15,
     max_tokens: int = 512,
+    timeout: float | None = None,
+    max_retries: int | None = None,
 ) -> dict[str, Any]:
     """Send *messages* to Groq chat completions.
 
+    *timeout* (seconds) and *max_retries* override the SDK defaults for this
+    call only; leave them as ``None`` to keep the client-wide settings.
+
     Returns::
         {"content": "<assistant text>", "model": "<model id>", "latency_ms": int}
 
     Raises RuntimeError on any API or network failure.
     """
     client = _get_client()
+    if max_retries is not None:
+        client = client.with_options(max_retries=max_retries)
     model = _get_model()
+    request_options: dict[str, Any] = {} if timeout is None else {"timeout": timeout}
 
     t0 = time.perf_counter()
     try:
@@ -57,6 +65,7 @@ def call_groq_chat(
             messages=messages,  # type: ignore[arg-type]
             temperature=temperature,
             max_tokens=max_tokens,
+            **request_options,
         )
     except APITimeoutError as exc:
         raise RuntimeError(f"Groq request timed out: {exc}") from exc
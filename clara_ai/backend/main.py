@@ -12,6 +12,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings, validate_voice_config
+from services._http import aclose_async_client
 from routes.health import router as health_router
 from routes.process import router as process_router
 from routes.demo import router as demo_router
@@ -81,6 +82,12 @@ async def _startup() -> None:
         logger.warning("Voice configuration warning on startup: %s", exc)
 
 
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    # Release pooled keep-alive connections to ElevenLabs
+    await aclose_async_client()
+
+
 # ── Run directly ──────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ import tempfile
 import os
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from models.schemas import AudioEchoResponse, SpeakRequest, SpeakReportSummaryRequest, VoiceStatusResponse
 
@@ -162,7 +162,7 @@ async def speak_report_summary(body: SpeakReportSummaryRequest) -> Response:
       2. Extract executive summary + generate 2-3 sentence core summary via LLM
       3. Compose spoken text: "Here is the report summary. {core_summary}"
       4. Synthesize with enrolled voice (if user_name) or edge-tts
-      5. Return MP3 audio
+      5. Return MP3 audio (streamed as it arrives for uncached enrolled voices)
     """
     import datetime
     import time
@@ -207,41 +207,42 @@ async def speak_report_summary(body: SpeakReportSummaryRequest) -> Response:
             user_name=body.user_name,
             language=body.language,
             gender=gender,
+            stream=True,
         )
     except Exception as exc:
         logger.error("TTS synthesis failed: %s", exc)
         raise HTTPException(status_code=502, detail=f"TTS synthesis failed: {exc}") from exc
 
     audio_bytes = tts_result["audio"]
+    audio_stream = tts_result.get("audio_stream")
     total_ms = int((time.perf_counter() - t0) * 1000)
 
-    # 5. Log diagnostics
+    # 5. Log diagnostics (total_ms is time to first audio when streaming)
     logger.info(
         "speak_report_summary: summary_provider=%s fallback=%s voice=%s tts=%s "
-        "summary_chars=%d audio_bytes=%d total_ms=%d",
+        "summary_chars=%d audio_bytes=%s total_ms=%d",
         summary_result["provider"],
         summary_result["fallback_used"],
         tts_result["voice_name"],
         tts_result["voice_provider"],
         len(core_summary),
-        len(audio_bytes),
+        "stream" if audio_stream is not None else len(audio_bytes),
         total_ms,
     )
 
     _speak_state["last_speak_at"] = datetime.datetime.utcnow().isoformat() + "Z"
     _speak_state["last_speak_voice"] = tts_result["voice_name"]
 
-    return Response(
-        content=audio_bytes,
-        media_type="audio/mpeg",
-        headers={
-            "X-Summary-Provider": summary_result["provider"],
-            "X-Summary-Fallback": str(summary_result["fallback_used"]),
-            "X-Voice-Provider": tts_result["voice_provider"],
-            "X-Voice-Name": tts_result["voice_name"],
-            "X-Total-Latency-Ms": str(total_ms),
-        },
-    )
+    headers = {
+        "X-Summary-Provider": summary_result["provider"],
+        "X-Summary-Fallback": str(summary_result["fallback_used"]),
+        "X-Voice-Provider": tts_result["voice_provider"],
+        "X-Voice-Name": tts_result["voice_name"],
+        "X-Total-Latency-Ms": str(total_ms),
+    }
+    if audio_stream is not None:
+        return StreamingResponse(audio_stream, media_type="audio/mpeg", headers=headers)
+    return Response(content=audio_bytes, media_type="audio/mpeg", headers=headers)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
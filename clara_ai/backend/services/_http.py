@@ -0,0 +1,54 @@
+"""Shared async HTTP client for outbound API calls (ElevenLabs enrollment + TTS)."""
+
+from __future__ import annotations
+
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it the client
+# speaks HTTP/1.1 over the same pool.
+try:
+    import h2  # type: ignore  # noqa: F401
+    _H2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _H2_AVAILABLE = False
+
+# ── Pool settings ─────────────────────────────────────────────────────────────
+
+_MAX_CONNECTIONS = 32
+_MAX_KEEPALIVE_CONNECTIONS = 16
+_DEFAULT_TIMEOUT = 30.0  # seconds; callers may pass a per-request timeout
+
+# ── Shared client ─────────────────────────────────────────────────────────────
+
+# One pool for every outbound call, so concurrent synthesis and enrollment
+# reuse warm TCP/TLS connections (multiplexed over one socket with HTTP/2)
+# instead of each keeping its own.
+_client: httpx.AsyncClient | None = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient (created lazily)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=_H2_AVAILABLE,
+            timeout=_DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        logger.info("Shared HTTP client created (http2=%s)", _H2_AVAILABLE)
+    return _client
+
+
+async def aclose_async_client() -> None:
+    """Close the shared client and its pooled connections (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -8,10 +8,13 @@ import subprocess
 import tempfile
 import time
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # ── Whisper lazy import ───────────────────────────────────────────────────────
@@ -104,6 +107,43 @@ def _convert_webm_to_wav(file_bytes: bytes) -> bytes:
                 pass
 
 
+def _prepare_pcm(
+    file_bytes: bytes,
+    fmt: str,
+    rate: int = 8000,
+    max_seconds: float | None = None,
+) -> tuple[np.ndarray, int]:
+    """Decode any ffmpeg-readable audio straight to mono int16 samples.
+
+    ffmpeg writes raw s16le PCM at *rate* Hz to stdout, so callers that only
+    need samples skip the WAV file + ``wave`` parse round-trip. *max_seconds*
+    stops decoding early. Returns (samples, rate).
+    """
+    import numpy as np  # whisper dependency
+
+    # Input still goes through a temp file: mp4/m4a need a seekable source
+    with tempfile.NamedTemporaryFile(suffix=f".{fmt}", delete=False) as src:
+        src.write(file_bytes)
+        src_path = src.name
+
+    cmd = ["ffmpeg", "-loglevel", "error", "-i", src_path]
+    if max_seconds is not None:
+        cmd += ["-t", str(max_seconds)]
+    cmd += ["-f", "s16le", "-ac", "1", "-ar", str(rate), "pipe:1"]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
+        if result.returncode != 0:
+            err = result.stderr.decode(errors="replace")
+            raise RuntimeError(f"ffmpeg decode failed: {err}")
+        return np.frombuffer(result.stdout, dtype="<i2"), rate
+    finally:
+        try:
+            os.remove(src_path)
+        except OSError:
+            pass
+
+
 def _prepare_bytes(file_bytes: bytes, fmt: str) -> tuple[bytes, str]:
     """Convert webm/ogg to wav so both Whisper and OpenAI can handle it.
 
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import io
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 from config import get_settings
 from models.schemas import CodeSwitchResult, IntentResult
@@ -11,6 +15,20 @@ from models.schemas import CodeSwitchResult, IntentResult
 if TYPE_CHECKING:
     pass
 
+# ── Static Markdown fragments ──────────────────────────────────────────────────
+
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+
+def _load_fragment(name: str) -> str:
+    """Read a static dossier fragment from services/templates/ (trailing newline stripped)."""
+    return (_TEMPLATES_DIR / name).read_text(encoding="utf-8").rstrip("\n")
+
+
+_ESCALATION_TABLE: str = _load_fragment("escalation_table.md")
+_ASSUMPTION_NOTE: str = _load_fragment("assumption_note.md")
+_FOOTER: str = _load_fragment("footer.md")
+
 # ── Risk matrix ───────────────────────────────────────────────────────────────
 
 _RISK_MATRIX: dict[str, dict[str, str]] = {
@@ -149,49 +167,161 @@ _GERMAN_SUMMARY_MAP: dict[str, str] = {
 }
 
 
+# Cross-language executive summary (section 12). The non-Latin scaffolding is
+# kept in module constants so only the value slots vary per dossier.
+_TAMIL_LINE: str = "**Tamil (தமிழ்):** சாதனம்: {1}. அறிகுறி: {2}. முன்னுரிமை: {4}."
+_MALAYALAM_LINE: str = "**Malayalam (മലയാളം):** ഉപകരണം: {1}. ലക്ഷണം: {2}. മുൻഗണന: {4}."
+
+# Positional slots: {0} risk level, {1} device, {2} symptom, {3} SLA,
+# {4} urgency, {5} German summary.
+_XLANG_TMPL: str = (
+    "**English:** Risk level {0}. Device: {1}. Symptom: {2}. {3}.\n\n"
+    + _TAMIL_LINE + "\n\n"
+    + _MALAYALAM_LINE + "\n\n"
+    + "**Deutsch:** {5}"
+)
+
+
 # ── Confidence caps ───────────────────────────────────────────────────────────
 
 _GENERIC_SYMPTOMS: frozenset[str] = frozenset({"unknown", "issue", "problem", ""})
 _CONFIDENCE_CAP_GENERIC: float = 0.85
 _CONFIDENCE_CAP_SPECIFIC: float = 0.95
 
+# Normalised symptom → cap. Symptoms outside this table are treated as specific.
+_CAP_BY_SYMPTOM: dict[str, float] = {
+    k: _CONFIDENCE_CAP_SPECIFIC for k in _HYPOTHESIS_MAP if k not in _GENERIC_SYMPTOMS
+} | {k: _CONFIDENCE_CAP_GENERIC for k in _GENERIC_SYMPTOMS}
+
+
+def _apply_confidence_cap(confidence: float, symptom_norm: str) -> float:
+    """Cap confidence based on whether the (already lower-cased, stripped) symptom is generic."""
+    return min(confidence, _CAP_BY_SYMPTOM.get(symptom_norm, _CONFIDENCE_CAP_SPECIFIC))
+
+
+# ── Assumption flags ──────────────────────────────────────────────────────────
+
+# Flag text by bit position, most significant first: device unknown,
+# symptom generic, component unknown, monolingual input.
+_ASSUMPTION_FLAGS: tuple[str, ...] = (
+    "Device defaulted to 'unknown' — field report did not name a specific unit.",
+    "Symptom could not be specifically classified; generic fault branch applied.",
+    "Suspected component not derived; hypothesis uses worst-case fault tree.",
+    "Input was single-language; code-switch analysis returned no mixed tokens.",
+)
+
+# All 16 flag combinations, pre-rendered as the section 11 Markdown list.
+_ASSUMPTION_BY_MASK: dict[int, str] = {
+    mask: "\n".join(
+        f"- {flag}"
+        for bit, flag in enumerate(_ASSUMPTION_FLAGS)
+        if mask & (1 << (len(_ASSUMPTION_FLAGS) - 1 - bit))
+    )
+    or "- No significant assumptions detected — high-confidence extraction."
+    for mask in range(1 << len(_ASSUMPTION_FLAGS))
+}
+
+
+# ── Static skeleton (sections 5–8) ────────────────────────────────────────────
+
+@lru_cache(maxsize=1024)
+def _render_static_skeleton(symptom: str, urgency: str) -> tuple[str, ...]:
+    """Render sections 5–8, which depend only on the symptom and urgency.
+
+    Field traffic concentrates on a handful of (symptom, urgency) pairs, so the
+    rendered sections are memoised and reused across dossiers.
+    """
+    risk = _RISK_MATRIX.get(urgency, _RISK_MATRIX["low"])
+    hypothesis = _HYPOTHESIS_MAP.get(symptom, _HYPOTHESIS_MAP["unknown"])
+    actions = _ACTIONS_MAP.get(symptom, _ACTIONS_MAP["unknown"])
+    action_list = "\n".join(f"{i + 1}. {a}" for i, a in enumerate(actions))
+
+    return (
+        f"""\
+## 5. Technical Hypothesis
+
+{hypothesis}
+
+This hypothesis is automatically generated based on symptom classification and industry
+fault patterns. It is intended to guide — not replace — qualified field diagnosis.
+
+---
+
+""",
+        f"""\
+## 6. Risk Level Assessment
+
+| Dimension | Assessment |
+|-----------|------------|
+| **Risk Classification** | {risk['colour']} {risk['level']} |
+| **Urgency** | {urgency.upper()} |
+| **SLA Commitment** | {risk['sla']} |
+| **Business Impact** | {"High — potential operational downtime" if urgency == "high" else "Medium — reduced operational efficiency" if urgency == "medium" else "Low — cosmetic or monitored condition"} |
+| **Safety Concern** | {"Yes — isolate device immediately" if urgency == "high" else "Monitor — do not exceed operational limits" if urgency == "medium" else "No immediate safety risk"} |
+
+---
+
+""",
+        f"""\
+## 7. Recommended Actions
+
+{action_list}
+
+---
 
-def _apply_confidence_cap(confidence: float, symptom: str) -> float:
-    """Cap confidence based on whether the symptom is generic or specific."""
-    cap = _CONFIDENCE_CAP_GENERIC if (symptom or "").lower().strip() in _GENERIC_SYMPTOMS else _CONFIDENCE_CAP_SPECIFIC
-    return min(confidence, cap)
+""",
+        f"""\
+## 8. Escalation Path
+
+**Primary Escalation:** {risk['escalation']}
+
+{_ESCALATION_TABLE}
+
+---
+
+""",
+    )
 
 
 # ── Main generator ────────────────────────────────────────────────────────────
 
-def generate_report(
+def iter_report_sections(
     transcript: str,
     codeswitch: CodeSwitchResult,
     intent: IntentResult,
-) -> str:
-    """Return a structured enterprise incident dossier in Markdown."""
+    *,
+    sections: frozenset[int] | None = None,
+) -> Iterator[str]:
+    """Yield the incident dossier as consecutive Markdown chunks.
+
+    The header, each numbered section and the footer are yielded separately so
+    streaming consumers can forward them without building the whole document.
+    Joining the chunks gives exactly the output of :func:`generate_report`.
+
+    *sections* restricts output to the given section numbers (1–12); the header
+    and footer are always emitted. Work for omitted sections is skipped.
+    """
+    def want(n: int) -> bool:
+        return sections is None or n in sections
+
     now = datetime.now(timezone.utc)
-    ts_iso = now.strftime("%Y-%m-%dT%H:%M:%SZ")
-    ts_human = now.strftime("%d %B %Y, %H:%M UTC")
     settings = get_settings()
+    ref_suffix = int.from_bytes(blake2b(transcript.encode("utf-8"), digest_size=4).digest(), "big") % 100000
+
+    symptom_lower = (intent.symptom or "").lower().strip()
+    device_lower = (intent.device or "").lower().strip()
+    comp_lower = (intent.suspected_component or "").lower().strip()
 
     # ── Confidence cap ────────────────────────────────────────────────────────
     raw_confidence = intent.confidence_score
-    capped_confidence = _apply_confidence_cap(raw_confidence, intent.symptom)
+    capped_confidence = _apply_confidence_cap(raw_confidence, symptom_lower)
     was_capped = capped_confidence < raw_confidence
 
     # ── Lookups ───────────────────────────────────────────────────────────────
     risk = _RISK_MATRIX.get(intent.urgency, _RISK_MATRIX["low"])
-    hypothesis = _HYPOTHESIS_MAP.get(intent.symptom, _HYPOTHESIS_MAP["unknown"])
-    actions = _ACTIONS_MAP.get(intent.symptom, _ACTIONS_MAP["unknown"])
 
     # ── Language analysis ─────────────────────────────────────────────────────
-    lang_count = len(codeswitch.language_mix)
-    is_multilingual = lang_count > 1
-    lang_lines = "\n".join(
-        f"| {lang.upper()} | {pct * 100:.0f}% | {'Primary' if i == 0 else 'Secondary'} |"
-        for i, (lang, pct) in enumerate(codeswitch.language_mix.items())
-    )
+    is_multilingual = len(codeswitch.language_mix) > 1
     if is_multilingual:
         lang_style = "multilingual field communication (code-switched)"
         lang_switch_note = "Yes — multilingual utterance"
@@ -199,86 +329,31 @@ def generate_report(
         lang_style = "informal field communication (single language)"
         lang_switch_note = "No — monolingual utterance"
 
-    # ── Actions ────────────────────────────────────────────────────────────────
-    action_list = "\n".join(f"{i + 1}. {a}" for i, a in enumerate(actions))
-    component_note = (
-        f"Suspected component: **{intent.suspected_component}**"
-        if intent.suspected_component and intent.suspected_component != "unknown"
-        else "Suspected component: *Not identified at this stage*"
-    )
-
-    # ── Confidence Justification ──────────────────────────────────────────────
-    symptom_lower = (intent.symptom or "").lower().strip()
-    device_lower = (intent.device or "").lower().strip()
-    comp_lower = (intent.suspected_component or "").lower().strip()
-
-    conf_factors: list[str] = []
-    if device_lower and device_lower != "unknown":
-        conf_factors.append(f"Device identifier resolved (`{intent.device}`)")
-    else:
-        conf_factors.append("Device identifier **not resolved** — reduces confidence")
-    if symptom_lower and symptom_lower not in _GENERIC_SYMPTOMS:
-        conf_factors.append(f"Specific symptom matched (`{intent.symptom}`)")
-    else:
-        conf_factors.append("Symptom is generic or unresolved — limits confidence")
-    if comp_lower and comp_lower != "unknown":
-        conf_factors.append(f"Suspected component identified (`{intent.suspected_component}`)")
-    else:
-        conf_factors.append("No suspected component identified")
-    if is_multilingual:
-        conf_factors.append("Code-switched input: pattern recognition reliability may be reduced")
-    if was_capped:
-        conf_factors.append(
-            f"Raw score {raw_confidence:.0%} capped at {capped_confidence:.0%} "
-            f"(generic symptom ceiling: {_CONFIDENCE_CAP_GENERIC:.0%})"
-        )
-    conf_reasoning = "\n".join(f"- {f}" for f in conf_factors)
-
-    # ── Data Completeness Score ──────────────────────────────────────────────
-    completeness_checks = [
-        ("Transcript non-empty", bool(transcript.strip())),
-        ("Device identified", device_lower not in ("", "unknown")),
-        ("Symptom identified", symptom_lower not in _GENERIC_SYMPTOMS),
-        ("Component identified", comp_lower not in ("", "unknown")),
-        ("Urgency set", intent.urgency in ("low", "medium", "high")),
-    ]
-    completeness_passed = sum(1 for _, v in completeness_checks if v)
-    completeness_pct = completeness_passed / len(completeness_checks)
-    completeness_rows = "\n".join(
-        f"| {label} | {'✅ Yes' if ok else '❌ No'} |"
-        for label, ok in completeness_checks
-    )
-
-    # ── Assumption Flags ──────────────────────────────────────────────────────
-    assumption_flags: list[str] = []
-    if device_lower in ("", "unknown"):
-        assumption_flags.append("Device defaulted to 'unknown' — field report did not name a specific unit.")
-    if symptom_lower in _GENERIC_SYMPTOMS:
-        assumption_flags.append(
-            "Symptom could not be specifically classified; generic fault branch applied."
-        )
-    if comp_lower in ("", "unknown"):
-        assumption_flags.append(
-            "Suspected component not derived; hypothesis uses worst-case fault tree."
-        )
-    if not is_multilingual:
-        assumption_flags.append(
-            "Input was single-language; code-switch analysis returned no mixed tokens."
-        )
-    if not assumption_flags:
-        assumption_flags.append("No significant assumptions detected — high-confidence extraction.")
-    assumption_list = "\n".join(f"- {f}" for f in assumption_flags)
-
-    dossier = f"""\
+    # ── Data Completeness Score (sections 1 and 10) ──────────────────────────
+    if want(1) or want(10):
+        completeness_checks = [
+            ("Transcript non-empty", bool(transcript) and not transcript.isspace()),
+            ("Device identified", device_lower not in ("", "unknown")),
+            ("Symptom identified", symptom_lower not in _GENERIC_SYMPTOMS),
+            ("Component identified", comp_lower not in ("", "unknown")),
+            ("Urgency set", intent.urgency in ("low", "medium", "high")),
+        ]
+        completeness_passed = sum(1 for _, v in completeness_checks if v)
+        completeness_pct = completeness_passed / len(completeness_checks)
+
+    yield f"""\
 # CLARA AI — ENTERPRISE INCIDENT DOSSIER
 
-**Reference ID:** CLARA-{now.strftime('%Y%m%d')}-{abs(hash(transcript)) % 100000:05d}
+**Reference ID:** CLARA-{now.strftime('%Y%m%d')}-{ref_suffix:05d}
 **Classification:** {risk['colour']} {risk['level']}
-**Generated:** {ts_human}
+**Generated:** {now.strftime("%d %B %Y, %H:%M UTC")}
 **System Version:** Clara AI v0.6 | Enterprise Mode {"ENABLED" if settings.enterprise_mode else "DISABLED"}
 
 ---
 
+"""
+    if want(1):
+        yield f"""\
 ## 1. Executive Summary
 
 A field incident has been registered and triaged by the Clara AI Vernacular Navigation Engine.
@@ -290,6 +365,9 @@ Recommended SLA: **{risk['sla']}**.
 
 ---
 
+"""
+    if want(2):
+        yield f"""\
 ## 2. Incident Description
 
 **Verbatim Field Report (Transcribed):**
@@ -302,6 +380,13 @@ and escalation.
 
 ---
 
+"""
+    if want(3):
+        lang_lines = "\n".join(
+            f"| {lang.upper()} | {pct * 100:.0f}% | {'Primary' if i == 0 else 'Secondary'} |"
+            for i, (lang, pct) in enumerate(codeswitch.language_mix.items())
+        )
+        yield f"""\
 ## 3. Language Analysis
 
 | Language | Composition | Role |
@@ -313,6 +398,14 @@ and escalation.
 
 ---
 
+"""
+    if want(4):
+        component_note = (
+            f"Suspected component: **{intent.suspected_component}**"
+            if intent.suspected_component and intent.suspected_component != "unknown"
+            else "Suspected component: *Not identified at this stage*"
+        )
+        yield f"""\
 ## 4. Intent & Device Details
 
 | Field | Extracted Value |
@@ -327,49 +420,30 @@ and escalation.
 
 ---
 
-## 5. Technical Hypothesis
-
-{hypothesis}
-
-This hypothesis is automatically generated based on symptom classification and industry
-fault patterns. It is intended to guide — not replace — qualified field diagnosis.
-
----
-
-## 6. Risk Level Assessment
-
-| Dimension | Assessment |
-|-----------|------------|
-| **Risk Classification** | {risk['colour']} {risk['level']} |
-| **Urgency** | {intent.urgency.upper()} |
-| **SLA Commitment** | {risk['sla']} |
-| **Business Impact** | {"High — potential operational downtime" if intent.urgency == "high" else "Medium — reduced operational efficiency" if intent.urgency == "medium" else "Low — cosmetic or monitored condition"} |
-| **Safety Concern** | {"Yes — isolate device immediately" if intent.urgency == "high" else "Monitor — do not exceed operational limits" if intent.urgency == "medium" else "No immediate safety risk"} |
-
----
-
-## 7. Recommended Actions
-
-{action_list}
-
----
-
-## 8. Escalation Path
-
-**Primary Escalation:** {risk['escalation']}
-
-| Level | Role | Trigger |
-|-------|------|---------|
-| L1 | Field Technician | Initial inspection and data collection |
-| L2 | Technical Supervisor | Fault confirmation and parts approval |
-| L3 | Senior Field Engineer | Complex repair or component replacement |
-| L4 | OEM / Vendor Support | Warranty claim or design-level fault |
-| L5 | Operations Manager | SLA breach or safety-critical incident |
-
-> **Note:** Escalate to next level if fault is unresolved within the defined SLA window.
-
----
-
+"""
+    if sections is None or not sections.isdisjoint(range(5, 9)):
+        skeleton = _render_static_skeleton(intent.symptom, intent.urgency)
+        yield from (chunk for n, chunk in enumerate(skeleton, start=5) if want(n))
+
+    if want(9):
+        conf_factors: list[str] = [
+            f"Device identifier resolved (`{intent.device}`)"
+            if device_lower and device_lower != "unknown"
+            else "Device identifier **not resolved** — reduces confidence",
+            f"Specific symptom matched (`{intent.symptom}`)"
+            if symptom_lower and symptom_lower not in _GENERIC_SYMPTOMS
+            else "Symptom is generic or unresolved — limits confidence",
+            f"Suspected component identified (`{intent.suspected_component}`)"
+            if comp_lower and comp_lower != "unknown"
+            else "No suspected component identified",
+            *(("Code-switched input: pattern recognition reliability may be reduced",) if is_multilingual else ()),
+            *((
+                f"Raw score {raw_confidence:.0%} capped at {capped_confidence:.0%} "
+                f"(generic symptom ceiling: {_CONFIDENCE_CAP_GENERIC:.0%})",
+            ) if was_capped else ()),
+        ]
+        conf_reasoning = "\n".join(f"- {f}" for f in conf_factors)
+        yield f"""\
 ## 9. Confidence Justification
 
 **Final confidence score: {capped_confidence:.0%}**{"  *(score was capped from raw " + f"{raw_confidence:.0%}" + ")*" if was_capped else ""}
@@ -378,6 +452,13 @@ fault patterns. It is intended to guide — not replace — qualified field diag
 
 ---
 
+"""
+    if want(10):
+        completeness_rows = "\n".join(
+            f"| {label} | {'✅ Yes' if ok else '❌ No'} |"
+            for label, ok in completeness_checks
+        )
+        yield f"""\
 ## 10. Data Completeness
 
 **Score: {completeness_pct:.0%}** ({completeness_passed} / {len(completeness_checks)} required fields populated)
@@ -388,36 +469,68 @@ fault patterns. It is intended to guide — not replace — qualified field diag
 
 ---
 
+"""
+    if want(11):
+        assumption_list = _ASSUMPTION_BY_MASK[
+            (device_lower in ("", "unknown")) << 3
+            | (symptom_lower in _GENERIC_SYMPTOMS) << 2
+            | (comp_lower in ("", "unknown")) << 1
+            | (not is_multilingual)
+        ]
+        yield f"""\
 ## 11. Assumption Flags
 
 {assumption_list}
 
-> Flags above describe where the AI system applied defaults or inference due to incomplete
-> field data. A certified engineer must verify all flagged items before actioning this report.
-"""
+{_ASSUMPTION_NOTE}
 
-    if settings.enterprise_mode:
-        cross_lang_summary = (
-            f"**English:** Risk level {risk['level']}. Device: {intent.device}. "
-            f"Symptom: {intent.symptom}. {risk['sla']}.\n\n"
-            f"**Tamil (தமிழ்):** சாதனம்: {intent.device}. அறிகுறி: {intent.symptom}. "
-            f"முன்னுரிமை: {intent.urgency.upper()}.\n\n"
-            f"**Malayalam (മലയാളം):** ഉപകരണം: {intent.device}. ലക്ഷണം: {intent.symptom}. "
-            f"മുൻഗണന: {intent.urgency.upper()}.\n\n"
-            f"**Deutsch:** {_GERMAN_SUMMARY_MAP.get(intent.symptom, _GERMAN_SUMMARY_MAP['unknown'])}"
-        )
-        dossier += f"""
 ---
 
+"""
+    if settings.enterprise_mode and want(12):
+        german_summary = _GERMAN_SUMMARY_MAP.get(intent.symptom, _GERMAN_SUMMARY_MAP["unknown"])
+        cross_lang_summary = _XLANG_TMPL.format(
+            risk["level"],
+            intent.device,
+            intent.symptom,
+            risk["sla"],
+            intent.urgency.upper(),
+            german_summary,
+        )
+        yield f"""\
 ## 12. Cross-Language Executive Summary
 
 {cross_lang_summary}
-"""
 
-    dossier += f"""
 ---
 
-*This dossier was automatically generated by Clara AI Enterprise v0.6 at `{ts_iso}`.*
-*All AI-generated content must be reviewed and validated by a certified field engineer before action.*
 """
-    return dossier
+
+    yield f"""\
+*This dossier was automatically generated by Clara AI Enterprise v0.6 at `{now.strftime("%Y-%m-%dT%H:%M:%SZ")}`.*
+{_FOOTER}
+"""
+
+
+def generate_report(
+    transcript: str,
+    codeswitch: CodeSwitchResult,
+    intent: IntentResult,
+    *,
+    sections: frozenset[int] | None = None,
+) -> str:
+    """Return a structured enterprise incident dossier in Markdown.
+
+    *sections* limits the dossier to the given section numbers (e.g.
+    ``frozenset({1})`` for a summary-only view); ``None`` renders all of them.
+    """
+    buf = io.StringIO()
+    buf.writelines(
+        iter_report_sections(
+            transcript,
+            codeswitch,
+            intent,
+            sections=sections,
+        )
+    )
+    return buf.getvalue()
@@ -1,23 +1,90 @@
 """Report summarization service — multi-provider with fallback.
 
-Provider chain (tried in order):
+LLM providers (called concurrently; the first valid response wins):
   1. Groq  (llama-3.3-70b-versatile — already configured)
   2. DeepSeek  (deepseek-chat via OpenAI-compatible API)
+Fallback when neither returns a valid response:
   3. Executive-summary extraction  (regex fallback, zero API calls)
+
+Every Groq call is explicitly bounded:
+  - timeout      _GROQ_TIMEOUT_S per request
+  - max_retries  _GROQ_MAX_RETRIES (0 — failover to DeepSeek is the retry)
+  - max_tokens   256 / 512 / 1024 depending on the operation
+  - input        ~_INPUT_TOKEN_BUDGET tokens; longer texts keep head + tail
+
+DeepSeek prompts are clipped to the same _MAX_PROMPT_CHARS input budget.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
+import hashlib
+import json
 import logging
 import os
 import re
+import sys
+import threading
 import time
-from typing import Any
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
+# ── Provider availability ─────────────────────────────────────────────────────
+
+# Credentials are read once at import (main.py loads .env before any service
+# module). With no keys configured, the provider tuples below are empty and
+# every call goes straight to the regex fallback.
+_DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY", "").strip() or None
+_HAS_GROQ = bool(os.getenv("GROQ_API_KEY", "").strip())
+_HAS_DEEPSEEK = _DEEPSEEK_API_KEY is not None
+
+if _HAS_GROQ:
+    try:
+        from llm.groq_adapter import call_groq_chat
+    except ImportError as exc:  # pragma: no cover
+        logger.warning("Groq adapter unavailable, Groq provider disabled: %s", exc)
+        _HAS_GROQ = False
+
+
+class _NoCredentials(Exception):
+    """A provider was called without an API key — configuration, not an outage."""
+
+# ── Compiled patterns ─────────────────────────────────────────────────────────
+
+# "## 1. Executive Summary" through to the next "## " heading or "---" rule
+_EXEC_SECTION_RE = re.compile(
+    r"##\s*1\.\s*Executive\s+Summary\s*\n(.*?)(?=\n##\s|\n---|\Z)", re.DOTALL | re.IGNORECASE
+)
+# Looser fallback: locates the first "executive summary" line, so only the
+# text after it is split into lines
+_EXEC_SUMMARY_HEADING_RE = re.compile(r"executive summary", re.IGNORECASE)
+# Markdown emphasis markers, stripped bold first: the italic pass then removes
+# what is left of nested runs such as ***x***
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_ITAL_RE = re.compile(r"\*([^*]+)\*")
+_WS_RE = re.compile(r"\s+")
+
+# Dossier fields used to grade the regex fallback
+_DEVICE_RE = re.compile(r"\*\*Device\*\*[:\s]+([^\n]+)")
+_SYMPTOM_RE = re.compile(r"\*\*Symptom\*\*[:\s]+([^\n]+)")
+_URGENCY_RE = re.compile(r"\*\*Urgency\*\*[:\s]+(\w+)", re.IGNORECASE)
+_CONFIDENCE_RE = re.compile(r"Confidence score[:\s]+(\d+)%", re.IGNORECASE)
+
+# Comma/period-delimited runs long enough to survive the > 5 char filter
+_SEGMENT_FINDER_RE = re.compile(r"[^,\.]{6,}")
+
 # ── Prompts ───────────────────────────────────────────────────────────────────
 
+# System prompts are interned at import and wrapped once in shared
+# *_SYSTEM_MSG dicts that every call reuses — never mutate them.
+
 _SUMMARISE_SYSTEM = (
     "You are a concise incident-report summariser for an enterprise field-service platform. "
     "Given the full text of an incident dossier, extract the **core problem summary** and "
@@ -26,12 +93,17 @@ _SUMMARISE_SYSTEM = (
     "Do not include markdown, bullet points, or section headers."
 )
 
-_SUMMARISE_USER_TMPL = (
-    "Here is the full incident report:\n\n"
-    "{report_text}\n\n"
-    "Extract the core problem summary and key recommendations from this "
-    "incident report, in 2–3 sentences."
-)
+_SUMMARISE_SYSTEM = sys.intern(_SUMMARISE_SYSTEM)
+_SUMMARISE_SYSTEM_MSG = {"role": "system", "content": _SUMMARISE_SYSTEM}
+
+
+def _summarise_messages(report_text: str) -> list[dict[str, str]]:
+    user_content = (
+        f"Here is the full incident report:\n\n{report_text}\n\n"
+        "Extract the core problem summary and key recommendations from this "
+        "incident report, in 2–3 sentences."
+    )
+    return [_SUMMARISE_SYSTEM_MSG, {"role": "user", "content": user_content}]
 
 # Executive-grade deep analysis prompt
 _EXECUTIVE_ANALYSIS_SYSTEM = (
@@ -55,10 +127,141 @@ _EXECUTIVE_ANALYSIS_SYSTEM = (
     "6) Do NOT include any report section labels in the summary. Focus on the problem, impact, and action."
 )
 
-_EXECUTIVE_ANALYSIS_USER_TMPL = (
-    "Analyze the following incident dossier and return only the JSON output:\n\n"
-    "{report_text}"
-)
+_EXECUTIVE_ANALYSIS_SYSTEM = sys.intern(_EXECUTIVE_ANALYSIS_SYSTEM)
+_EXECUTIVE_ANALYSIS_SYSTEM_MSG = {"role": "system", "content": _EXECUTIVE_ANALYSIS_SYSTEM}
+
+
+def _executive_analysis_messages(report_text: str) -> list[dict[str, str]]:
+    user_content = f"Analyze the following incident dossier and return only the JSON output:\n\n{report_text}"
+    return [_EXECUTIVE_ANALYSIS_SYSTEM_MSG, {"role": "user", "content": user_content}]
+
+
+# ── Adaptive provider timeouts ────────────────────────────────────────────────
+
+# Cold-start timeout (seconds) per provider call site, used until enough
+# latency history exists to derive an adaptive one. It is also the ceiling of
+# the adaptive timeout, whose floor is _MIN_TIMEOUT_FRACTION of it (and never
+# below _MIN_TIMEOUT_S). A call that times out is recorded as a latency of
+# twice the timeout it was given, so once a provider slows down the p95 — and
+# with it the timeout — climbs back towards the static value instead of every
+# call failing at the old, fast-provider timeout.
+_PROVIDER_TIMEOUTS: dict[str, float] = {
+    "deepseek.summarise": 30.0,
+    "deepseek.analyse_executive": 30.0,
+    "deepseek.extract_incident": 30.0,
+}
+_MIN_TIMEOUT_S = 2.0
+_MIN_TIMEOUT_FRACTION = 0.2
+_TIMEOUT_P95_FACTOR = 1.3
+_MIN_LATENCY_SAMPLES = 10
+
+_LATENCY_HISTORY: defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=50))
+_LATENCY_LOCK = threading.Lock()
+
+
+def _provider_timeout(key: str) -> float:
+    """Return the request timeout for *key*: 1.3 × rolling p95 latency, clamped
+    between the floor and the static ``_PROVIDER_TIMEOUTS`` entry.
+
+    Falls back to the static entry until ``_MIN_LATENCY_SAMPLES`` calls have
+    been recorded.
+    """
+    static = _PROVIDER_TIMEOUTS[key]
+    with _LATENCY_LOCK:
+        samples = sorted(_LATENCY_HISTORY[key])
+    if len(samples) < _MIN_LATENCY_SAMPLES:
+        return static
+    p95 = samples[int(0.95 * (len(samples) - 1))]
+    floor = max(_MIN_TIMEOUT_S, static * _MIN_TIMEOUT_FRACTION)
+    return min(static, max(floor, p95 * _TIMEOUT_P95_FACTOR))
+
+
+def _record_latency(key: str, latency_ms: int) -> None:
+    with _LATENCY_LOCK:
+        _LATENCY_HISTORY[key].append(latency_ms / 1000)
+
+
+def _record_timeout(key: str, timeout_s: float) -> None:
+    """Record a call that hit *timeout_s*: its true latency is at least that."""
+    with _LATENCY_LOCK:
+        _LATENCY_HISTORY[key].append(min(_PROVIDER_TIMEOUTS[key], 2 * timeout_s))
+
+
+# ── LLM response parsing ──────────────────────────────────────────────────────
+
+# orjson (optional) encodes DeepSeek payloads and decodes response envelopes;
+# stdlib json is the drop-in fallback. LLM content keeps the stdlib
+# raw_decode below because orjson cannot stop at the end of a leading object.
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+_DECODER = json.JSONDecoder()
+
+# Raw LLM output quoted in parse-failure logs is capped at this many characters
+_LOG_CONTENT_CHARS = 500
+
+
+def _parse_llm_json(content: str) -> dict[str, Any]:
+    """Decode the first JSON object in *content*, ignoring any fence or prose around it."""
+    idx = content.find("{")
+    if idx < 0:
+        raise json.JSONDecodeError("no JSON object", content, 0)
+    obj, _ = _DECODER.raw_decode(content, idx)
+    return obj
+
+
+# ── Request bounds ────────────────────────────────────────────────────────────
+
+_GROQ_TIMEOUT_S = 8.0
+_GROQ_MAX_RETRIES = 0
+_INPUT_TOKEN_BUDGET = 12_000
+_CHARS_PER_TOKEN = 4  # rough estimate for English-heavy prompts
+_MAX_PROMPT_CHARS = _INPUT_TOKEN_BUDGET * _CHARS_PER_TOKEN
+
+
+def _clip_to_budget(text: str, max_chars: int = _MAX_PROMPT_CHARS) -> str:
+    """Drop the middle of *text* when it exceeds *max_chars*, keeping head and tail.
+
+    When the dossier's Executive Summary section fits in the budget, the head is
+    extended to keep that section intact.
+    """
+    if len(text) <= max_chars:
+        return text
+    head = max_chars // 2
+    m = _EXEC_SECTION_RE.search(text)
+    if m and m.end() < max_chars:
+        head = max(head, m.end())
+    return text[:head] + "\n...[truncated]...\n" + text[head - max_chars:]
+
+
+# ── DeepSeek client ──────────────────────────────────────────────────────────
+
+_DEEPSEEK_CLIENT: httpx.Client | None = None
+_DEEPSEEK_CLIENT_LOCK = threading.Lock()
+
+
+def _get_deepseek_client() -> httpx.Client:
+    """Return the shared keep-alive client for api.deepseek.com (created lazily)."""
+    global _DEEPSEEK_CLIENT
+    if _DEEPSEEK_CLIENT is None:
+        with _DEEPSEEK_CLIENT_LOCK:
+            if _DEEPSEEK_CLIENT is None:
+                _DEEPSEEK_CLIENT = httpx.Client(
+                    base_url="https://api.deepseek.com",
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+                )
+                atexit.register(_DEEPSEEK_CLIENT.close)
+    return _DEEPSEEK_CLIENT
 
 
 # ── Provider 1: Groq ─────────────────────────────────────────────────────────
@@ -66,15 +269,17 @@ _EXECUTIVE_ANALYSIS_USER_TMPL = (
 
 def _summarise_groq(report_text: str) -> dict[str, Any]:
     """Summarise via Groq (llama-3.3-70b-versatile)."""
-    from llm.groq_adapter import call_groq_chat
-
-    messages = [
-        {"role": "system", "content": _SUMMARISE_SYSTEM},
-        {"role": "user", "content": _SUMMARISE_USER_TMPL.format(report_text=report_text)},
-    ]
-    t0 = time.perf_counter()
-    result = call_groq_chat(messages, temperature=0.15, max_tokens=256)
-    latency = int((time.perf_counter() - t0) * 1000)
+    report_text = _clip_to_budget(report_text)
+    messages = _summarise_messages(report_text)
+    t0 = time.monotonic_ns()
+    result = call_groq_chat(
+        messages,
+        temperature=0.15,
+        max_tokens=256,
+        timeout=_GROQ_TIMEOUT_S,
+        max_retries=_GROQ_MAX_RETRIES,
+    )
+    latency = (time.monotonic_ns() - t0) // 1_000_000
 
     summary = (result.get("content") or "").strip()
     if not summary:
@@ -92,40 +297,52 @@ def _summarise_groq(report_text: str) -> dict[str, Any]:
 # ── Provider 2: DeepSeek ─────────────────────────────────────────────────────
 
 
+def _post_deepseek(key: str, payload: dict[str, Any]) -> tuple[httpx.Response, int]:
+    """POST *payload* to DeepSeek chat completions under the adaptive timeout for *key*.
+
+    Returns the 200 response and its latency in ms; records the latency (or the
+    timeout) for *key*. Non-200 responses raise ``RuntimeError``.
+    """
+    timeout = _provider_timeout(key)
+    t0 = time.monotonic_ns()
+    try:
+        resp = _get_deepseek_client().post(
+            "/chat/completions",
+            headers={
+                "Authorization": f"Bearer {_DEEPSEEK_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            content=_dumps(payload),
+            timeout=timeout,
+        )
+    except httpx.TimeoutException:
+        _record_timeout(key, timeout)
+        raise
+    latency = (time.monotonic_ns() - t0) // 1_000_000
+
+    if resp.status_code != 200:
+        raise RuntimeError(f"DeepSeek HTTP {resp.status_code}: {resp.text[:300]}")
+    _record_latency(key, latency)
+    return resp, latency
+
+
 def _summarise_deepseek(report_text: str) -> dict[str, Any]:
     """Summarise via DeepSeek chat (OpenAI-compatible endpoint)."""
-    import httpx
+    if _DEEPSEEK_API_KEY is None:
+        raise _NoCredentials("deepseek")
 
-    api_key = os.getenv("DEEPSEEK_API_KEY", "").strip()
-    if not api_key:
-        raise RuntimeError("DEEPSEEK_API_KEY not set")
+    report_text = _clip_to_budget(report_text)
 
     payload = {
         "model": "deepseek-chat",
-        "messages": [
-            {"role": "system", "content": _SUMMARISE_SYSTEM},
-            {"role": "user", "content": _SUMMARISE_USER_TMPL.format(report_text=report_text)},
-        ],
+        "messages": _summarise_messages(report_text),
         "temperature": 0.15,
         "max_tokens": 256,
     }
 
-    t0 = time.perf_counter()
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.post(
-            "https://api.deepseek.com/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
-    latency = int((time.perf_counter() - t0) * 1000)
-
-    if resp.status_code != 200:
-        raise RuntimeError(f"DeepSeek HTTP {resp.status_code}: {resp.text[:300]}")
+    resp, latency = _post_deepseek("deepseek.summarise", payload)
 
-    body = resp.json()
+    body = _loads(resp.content)
     summary = (body["choices"][0]["message"]["content"] or "").strip()
     if not summary:
         raise ValueError("DeepSeek returned empty summary")
@@ -143,29 +360,29 @@ def _summarise_deepseek(report_text: str) -> dict[str, Any]:
 # ── Fallback: regex extraction ────────────────────────────────────────────────
 
 
+def _strip_md(text: str) -> str:
+    """Drop **bold** then *italic* markers from *text*."""
+    return _ITAL_RE.sub(r"\1", _BOLD_RE.sub(r"\1", text))
+
+
 def _extract_executive_summary(report_text: str) -> str:
     """Pull the Executive Summary section from the markdown report."""
-    # Match "## 1. Executive Summary" through to next "## " or "---"
-    pattern = r"##\s*1\.\s*Executive\s+Summary\s*\n(.*?)(?=\n##\s|\n---|\Z)"
-    m = re.search(pattern, report_text, re.DOTALL | re.IGNORECASE)
+    m = _EXEC_SECTION_RE.search(report_text)
     if m:
-        raw = m.group(1).strip()
-        # Strip markdown formatting
-        clean = re.sub(r"\*\*([^*]+)\*\*", r"\1", raw)
-        clean = re.sub(r"\*([^*]+)\*", r"\1", clean)
-        clean = re.sub(r"\s+", " ", clean).strip()
+        clean = _WS_RE.sub(" ", _strip_md(m.group(1))).strip()
         if clean:
             return clean
 
-    # Fallback: first 3 non-empty lines after any "Executive Summary" heading
-    lines = report_text.splitlines()
-    capture = False
-    collected: list[str] = []
-    for line in lines:
-        if "executive summary" in line.lower():
-            capture = True
-            continue
-        if capture:
+    # Fallback: first 5 content lines after the first "Executive Summary" line,
+    # skipping blank lines, single-# headings and repeated heading lines and
+    # stopping at a "##" heading or "---" rule
+    m = _EXEC_SUMMARY_HEADING_RE.search(report_text)
+    if m:
+        collected: list[str] = []
+        # splitlines() handles \n, \r\n and \r; element 0 is the rest of the heading line
+        for line in report_text[m.end():].splitlines()[1:]:
+            if "executive summary" in line.lower():
+                continue
             stripped = line.strip()
             if stripped.startswith("##") or stripped.startswith("---"):
                 break
@@ -173,21 +390,18 @@ def _extract_executive_summary(report_text: str) -> str:
                 collected.append(stripped)
             if len(collected) >= 5:
                 break
-
-    if collected:
-        text = " ".join(collected)
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
-        text = re.sub(r"\*([^*]+)\*", r"\1", text)
-        return text.strip()
+        if collected:
+            text = " ".join(collected)
+            return _strip_md(text).strip()
 
     # Last resort: first 300 chars
     return report_text[:300].strip()
 
 
 def _summarise_fallback(report_text: str) -> dict[str, Any]:
-    t0 = time.perf_counter()
+    t0 = time.monotonic_ns()
     summary = _extract_executive_summary(report_text)
-    latency = int((time.perf_counter() - t0) * 1000)
+    latency = (time.monotonic_ns() - t0) // 1_000_000
     logger.info("summarise_fallback (regex): %d chars", len(summary))
     return {
         "summary": summary,
@@ -202,16 +416,17 @@ def _summarise_fallback(report_text: str) -> dict[str, Any]:
 
 def _analyse_executive_groq(report_text: str) -> dict[str, Any]:
     """Executive-grade analysis via Groq (llama-3.3-70b-versatile)."""
-    import json
-    from llm.groq_adapter import call_groq_chat
-
-    messages = [
-        {"role": "system", "content": _EXECUTIVE_ANALYSIS_SYSTEM},
-        {"role": "user", "content": _EXECUTIVE_ANALYSIS_USER_TMPL.format(report_text=report_text)},
-    ]
-    t0 = time.perf_counter()
-    result = call_groq_chat(messages, temperature=0.1, max_tokens=512)
-    latency = int((time.perf_counter() - t0) * 1000)
+    report_text = _clip_to_budget(report_text)
+    messages = _executive_analysis_messages(report_text)
+    t0 = time.monotonic_ns()
+    result = call_groq_chat(
+        messages,
+        temperature=0.1,
+        max_tokens=512,
+        timeout=_GROQ_TIMEOUT_S,
+        max_retries=_GROQ_MAX_RETRIES,
+    )
+    latency = (time.monotonic_ns() - t0) // 1_000_000
 
     content = (result.get("content") or "").strip()
     if not content:
@@ -219,12 +434,7 @@ def _analyse_executive_groq(report_text: str) -> dict[str, Any]:
 
     # Parse JSON response
     try:
-        # Try to extract JSON from markdown code blocks if present
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-        if json_match:
-            content = json_match.group(1)
-        
-        parsed = json.loads(content)
+        parsed = _parse_llm_json(content)
         if "core_summary" not in parsed or "confidence" not in parsed:
             raise ValueError("Missing required fields in JSON response")
         
@@ -237,57 +447,34 @@ def _analyse_executive_groq(report_text: str) -> dict[str, Any]:
             "latency_ms": latency,
         }
     except json.JSONDecodeError as e:
-        logger.error("Failed to parse Groq JSON response: %s\nContent: %s", e, content)
+        logger.error("Failed to parse Groq JSON response: %s\nContent: %s", e, content[:_LOG_CONTENT_CHARS])
         raise ValueError(f"Invalid JSON from Groq: {e}")
 
 
 def _analyse_executive_deepseek(report_text: str) -> dict[str, Any]:
     """Executive-grade analysis via DeepSeek chat."""
-    import json
-    import httpx
+    if _DEEPSEEK_API_KEY is None:
+        raise _NoCredentials("deepseek")
 
-    api_key = os.getenv("DEEPSEEK_API_KEY", "").strip()
-    if not api_key:
-        raise RuntimeError("DEEPSEEK_API_KEY not set")
+    report_text = _clip_to_budget(report_text)
 
     payload = {
         "model": "deepseek-chat",
-        "messages": [
-            {"role": "system", "content": _EXECUTIVE_ANALYSIS_SYSTEM},
-            {"role": "user", "content": _EXECUTIVE_ANALYSIS_USER_TMPL.format(report_text=report_text)},
-        ],
+        "messages": _executive_analysis_messages(report_text),
         "temperature": 0.1,
         "max_tokens": 512,
     }
 
-    t0 = time.perf_counter()
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.post(
-            "https://api.deepseek.com/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
-    latency = int((time.perf_counter() - t0) * 1000)
+    resp, latency = _post_deepseek("deepseek.analyse_executive", payload)
 
-    if resp.status_code != 200:
-        raise RuntimeError(f"DeepSeek HTTP {resp.status_code}: {resp.text[:300]}")
-
-    body = resp.json()
+    body = _loads(resp.content)
     content = (body["choices"][0]["message"]["content"] or "").strip()
     if not content:
         raise ValueError("DeepSeek returned empty response")
 
     # Parse JSON response
     try:
-        # Try to extract JSON from markdown code blocks if present
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-        if json_match:
-            content = json_match.group(1)
-        
-        parsed = json.loads(content)
+        parsed = _parse_llm_json(content)
         if "core_summary" not in parsed or "confidence" not in parsed:
             raise ValueError("Missing required fields in JSON response")
         
@@ -301,20 +488,20 @@ def _analyse_executive_deepseek(report_text: str) -> dict[str, Any]:
             "latency_ms": latency,
         }
     except json.JSONDecodeError as e:
-        logger.error("Failed to parse DeepSeek JSON response: %s\nContent: %s", e, content)
+        logger.error("Failed to parse DeepSeek JSON response: %s\nContent: %s", e, content[:_LOG_CONTENT_CHARS])
         raise ValueError(f"Invalid JSON from DeepSeek: {e}")
 
 
 def _analyse_executive_fallback(report_text: str) -> dict[str, Any]:
     """Fallback executive analysis using regex extraction with confidence scoring."""
-    t0 = time.perf_counter()
+    t0 = time.monotonic_ns()
     exec_summary = _extract_executive_summary(report_text)
     
     # Extract key fields using regex for confidence assessment
-    device_match = re.search(r'\*\*Device\*\*[:\s]+([^\n]+)', report_text)
-    symptom_match = re.search(r'\*\*Symptom\*\*[:\s]+([^\n]+)', report_text)
-    urgency_match = re.search(r'\*\*Urgency\*\*[:\s]+(\w+)', report_text, re.IGNORECASE)
-    confidence_match = re.search(r'Confidence score[:\s]+(\d+)%', report_text, re.IGNORECASE)
+    device_match = _DEVICE_RE.search(report_text)
+    symptom_match = _SYMPTOM_RE.search(report_text)
+    urgency_match = _URGENCY_RE.search(report_text)
+    confidence_match = _CONFIDENCE_RE.search(report_text)
     
     # Count how many fields were identified
     fields_found = sum([
@@ -332,7 +519,7 @@ def _analyse_executive_fallback(report_text: str) -> dict[str, Any]:
     else:
         confidence = "low"
     
-    latency = int((time.perf_counter() - t0) * 1000)
+    latency = (time.monotonic_ns() - t0) // 1_000_000
     logger.info("analyse_executive_fallback (regex): confidence=%s, %d chars", confidence, len(exec_summary))
     
     return {
@@ -345,9 +532,203 @@ def _analyse_executive_fallback(report_text: str) -> dict[str, Any]:
 
 
 
+# ── Circuit breakers ──────────────────────────────────────────────────────────
+
+# After _BREAKER_THRESHOLD consecutive failures a provider is skipped for
+# _BREAKER_COOLDOWN_S; the first call after that is a trial, and one more
+# failure reopens the breaker straight away.
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN_S = 30.0
+
+
+class _CBState:
+    """Consecutive-failure count and open-until deadline for one provider."""
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+
+
+_BREAKERS: dict[str, _CBState] = {"groq": _CBState(), "deepseek": _CBState()}
+_BREAKER_LOCK = threading.Lock()
+
+
+def _breaker_open(name: str) -> bool:
+    with _BREAKER_LOCK:
+        return _BREAKERS[name].open_until > time.monotonic()
+
+
+def _record_outcome(name: str, fut: Future) -> None:
+    """Done-callback: update *name*'s breaker from a finished provider call."""
+    if fut.cancelled():
+        return
+    exc = fut.exception()
+    if isinstance(exc, _NoCredentials):
+        return
+    with _BREAKER_LOCK:
+        state = _BREAKERS[name]
+        if exc is None:
+            state.failures = 0
+            state.open_until = 0.0
+            return
+        state.failures += 1
+        if state.failures >= _BREAKER_THRESHOLD:
+            state.open_until = time.monotonic() + _BREAKER_COOLDOWN_S
+            logger.warning(
+                "%s circuit open for %.0fs after %d consecutive failures",
+                name, _BREAKER_COOLDOWN_S, state.failures,
+            )
+
+
+# ── Provider race ─────────────────────────────────────────────────────────────
+
+# One worker pool per provider. A race returns as soon as one provider wins,
+# but the loser's HTTP call cannot be aborted once running and keeps its
+# worker until it completes or times out. With separate pools those leftover
+# calls only ever queue ahead of later calls to the same (slower) provider,
+# never ahead of the provider that is winning; a queued call whose race has
+# already been decided is cancelled before it starts.
+_PROVIDER_POOL_WORKERS = 8
+_PROVIDER_POOLS: dict[str, ThreadPoolExecutor] = {
+    name: ThreadPoolExecutor(max_workers=_PROVIDER_POOL_WORKERS, thread_name_prefix=f"llm-{name}")
+    for name in ("groq", "deepseek")
+}
+
+# Worker threads that set ``pools`` on this (batch workers) submit their
+# provider calls there instead of the shared pools.
+_POOL_OVERRIDE = threading.local()
+
+ProviderFn = Callable[[str], dict[str, Any]]
+
+
+def _first_valid_result(
+    operation: str,
+    providers: Iterable[tuple[str, ProviderFn]],
+    text: str,
+    check: Callable[[dict[str, Any]], str | None],
+) -> dict[str, Any] | None:
+    """Call every provider concurrently and return the first result that passes *check*.
+
+    *check* returns ``None`` for a usable result or a short reason for rejecting
+    it. Latency is bounded by the fastest healthy provider rather than the sum
+    of failures. Providers whose circuit breaker is open are not called.
+    Losing calls are cancelled if still queued; calls already in flight run to
+    completion in their provider's pool, still feed their breaker, and are
+    otherwise discarded.
+    Returns ``None`` when no provider produced a valid result.
+    """
+    futures: dict[Future, str] = {}
+    for name, fn in providers:
+        if _breaker_open(name):
+            logger.debug("%s %s: circuit open, skipping", operation, name)
+            continue
+        fut = getattr(_POOL_OVERRIDE, "pools", _PROVIDER_POOLS)[name].submit(fn, text)
+        fut.add_done_callback(functools.partial(_record_outcome, name))
+        futures[fut] = name
+    try:
+        for fut in as_completed(futures):
+            name = futures[fut]
+            try:
+                result = fut.result()
+            except _NoCredentials:
+                continue
+            except Exception as exc:
+                logger.warning("%s %s failed: %s", operation, name, exc)
+                continue
+            problem = check(result)
+            if problem:
+                logger.warning("%s %s: %s, skipping", operation, name, problem)
+                continue
+            return result
+    finally:
+        for fut in futures:
+            fut.cancel()
+    return None
+
+
+def _providers(groq: ProviderFn, deepseek: ProviderFn) -> tuple[tuple[str, ProviderFn], ...]:
+    """Return the ``(name, fn)`` pairs whose credentials are configured."""
+    return tuple(
+        (name, fn)
+        for name, fn, enabled in (("groq", groq, _HAS_GROQ), ("deepseek", deepseek, _HAS_DEEPSEEK))
+        if enabled
+    )
+
+
+def _check_summary(result: dict[str, Any]) -> str | None:
+    # Validate: must be 10-1000 chars, non-empty
+    n = len(result["summary"])
+    return f"invalid length {n}" if n < 10 or n > 1000 else None
+
+
+def _check_executive_analysis(result: dict[str, Any]) -> str | None:
+    # Validate: core_summary must be 20-1200 chars
+    n = len(result["core_summary"])
+    if n < 20 or n > 1200:
+        return f"invalid summary length {n}"
+    # Validate: confidence must be one of the expected values
+    if result["confidence"] not in ("high", "medium", "low"):
+        return f"invalid confidence '{result['confidence']}'"
+    return None
+
+
+def _check_incident(result: dict[str, Any]) -> str | None:
+    if not result.get("core_summary") or len(result["core_summary"]) < 10:
+        return "invalid summary"
+    if result.get("confidence") not in ("high", "medium", "low"):
+        return "invalid confidence"
+    return None
+
+
+# ── Result cache ──────────────────────────────────────────────────────────────
+
+# LRU of successful LLM results keyed by BLAKE2b(operation, input text), so
+# retries, UI refreshes and duplicate webhook deliveries skip the API call.
+# Regex-fallback results are never cached, so a transient outage is not pinned.
+_SUMMARY_CACHE: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+_SUMMARY_CACHE_MAX = 512
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+
+def _memoised(fn: Callable[[str], dict[str, Any]]) -> Callable[[str], dict[str, Any]]:
+    """Cache *fn*'s non-fallback results in the shared LRU; callers get deep copies."""
+    operation = fn.__name__.encode()
+
+    @functools.wraps(fn)
+    def wrapper(text: str) -> dict[str, Any]:
+        key = hashlib.blake2b(operation + b"\0" + text.encode("utf-8"), digest_size=16).digest()
+        with _SUMMARY_CACHE_LOCK:
+            cached = _SUMMARY_CACHE.get(key)
+            if cached is not None:
+                _SUMMARY_CACHE.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = fn(text)
+        if result.get("provider") != "fallback_regex":
+            with _SUMMARY_CACHE_LOCK:
+                _SUMMARY_CACHE[key] = copy.deepcopy(result)
+                _SUMMARY_CACHE.move_to_end(key)
+                while len(_SUMMARY_CACHE) > _SUMMARY_CACHE_MAX:
+                    _SUMMARY_CACHE.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def clear_summary_cache() -> None:
+    """Drop every cached LLM result (used by tests)."""
+    with _SUMMARY_CACHE_LOCK:
+        _SUMMARY_CACHE.clear()
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
+_SUMMARISE_PROVIDERS = _providers(_summarise_groq, _summarise_deepseek)
+_ANALYSE_PROVIDERS = _providers(_analyse_executive_groq, _analyse_executive_deepseek)
+
 
+@_memoised
 def summarise_report(report_text: str) -> dict[str, Any]:
     """Summarise *report_text* using the best available provider.
 
@@ -363,34 +744,21 @@ def summarise_report(report_text: str) -> dict[str, Any]:
     """
     exec_summary = _extract_executive_summary(report_text)
 
-    # Try providers in priority order
-    providers = [
-        ("groq", _summarise_groq),
-        ("deepseek", _summarise_deepseek),
-    ]
-
-    for name, fn in providers:
-        try:
-            result = fn(report_text)
-            summary = result["summary"]
-
-            # Validate: must be 10-500 chars, non-empty
-            if len(summary) < 10 or len(summary) > 1000:
-                logger.warning("summarise %s: invalid length %d, skipping", name, len(summary))
-                continue
-
-            return {
-                "executive_summary": exec_summary,
-                "core_summary": summary,
-                "provider": result["provider"],
-                "model": result["model"],
-                "latency_ms": result["latency_ms"],
-                "fallback_used": False,
-            }
-
-        except Exception as exc:
-            logger.warning("summarise %s failed: %s", name, exc)
-            continue
+    result = _first_valid_result(
+        "summarise",
+        _SUMMARISE_PROVIDERS,
+        report_text,
+        _check_summary,
+    )
+    if result is not None:
+        return {
+            "executive_summary": exec_summary,
+            "core_summary": result["summary"],
+            "provider": result["provider"],
+            "model": result["model"],
+            "latency_ms": result["latency_ms"],
+            "fallback_used": False,
+        }
 
     # All LLM providers failed — use regex fallback
     fb = _summarise_fallback(report_text)
@@ -404,6 +772,42 @@ def summarise_report(report_text: str) -> dict[str, Any]:
     }
 
 
+# Matches the DeepSeek client's keep-alive pool (max_keepalive_connections=10).
+_BATCH_CONCURRENCY = 10
+
+# Batches race their providers in per-provider pools of their own, with a
+# worker for every in-flight report. In the shared 8-worker pools a batch
+# would queue its calls ahead of interactive summaries. Concurrent batches
+# share these pools with each other.
+_BATCH_PROVIDER_POOLS: dict[str, ThreadPoolExecutor] = {
+    name: ThreadPoolExecutor(max_workers=_BATCH_CONCURRENCY, thread_name_prefix=f"llm-{name}-batch")
+    for name in ("groq", "deepseek")
+}
+
+
+def _use_batch_provider_pools() -> None:
+    _POOL_OVERRIDE.pools = _BATCH_PROVIDER_POOLS
+
+
+def summarise_reports_batch(texts: list[str]) -> list[dict[str, Any]]:
+    """Summarise many reports concurrently; results are in the same order as *texts*.
+
+    Up to ``_BATCH_CONCURRENCY`` reports are in flight at once, each racing
+    its providers in ``_BATCH_PROVIDER_POOLS`` rather than the shared provider
+    pools, so a burst (nightly batch, "summarise all") costs roughly N / 10
+    provider round-trips instead of N and never delays interactive requests.
+    """
+    if not texts:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(_BATCH_CONCURRENCY, len(texts)),
+        thread_name_prefix="summarise-batch",
+        initializer=_use_batch_provider_pools,
+    ) as pool:
+        return list(pool.map(summarise_report, texts))
+
+
+@_memoised
 def analyse_executive_report(report_text: str) -> dict[str, Any]:
     """Perform executive-grade deep analysis of an incident report.
 
@@ -422,45 +826,21 @@ def analyse_executive_report(report_text: str) -> dict[str, Any]:
           "fallback_used": bool,
         }
     """
-    # Try providers in priority order
-    providers = [
-        ("groq", _analyse_executive_groq),
-        ("deepseek", _analyse_executive_deepseek),
-    ]
-
-    for name, fn in providers:
-        try:
-            result = fn(report_text)
-            
-            # Validate: core_summary must be 20-800 chars
-            summary_len = len(result["core_summary"])
-            if summary_len < 20 or summary_len > 1200:
-                logger.warning(
-                    "analyse_executive %s: invalid summary length %d, skipping", 
-                    name, summary_len
-                )
-                continue
-
-            # Validate: confidence must be one of the expected values
-            if result["confidence"] not in ("high", "medium", "low"):
-                logger.warning(
-                    "analyse_executive %s: invalid confidence '%s', skipping",
-                    name, result["confidence"]
-                )
-                continue
-
-            return {
-                "core_summary": result["core_summary"],
-                "confidence": result["confidence"],
-                "provider": result["provider"],
-                "model": result["model"],
-                "latency_ms": result["latency_ms"],
-                "fallback_used": False,
-            }
-
-        except Exception as exc:
-            logger.warning("analyse_executive %s failed: %s", name, exc)
-            continue
+    result = _first_valid_result(
+        "analyse_executive",
+        _ANALYSE_PROVIDERS,
+        report_text,
+        _check_executive_analysis,
+    )
+    if result is not None:
+        return {
+            "core_summary": result["core_summary"],
+            "confidence": result["confidence"],
+            "provider": result["provider"],
+            "model": result["model"],
+            "latency_ms": result["latency_ms"],
+            "fallback_used": False,
+        }
 
     # All LLM providers failed — use regex fallback
     fb = _analyse_executive_fallback(report_text)
@@ -516,26 +896,32 @@ _INCIDENT_EXTRACTION_SYSTEM = (
     "- Never hallucinate — if unsure, mark confidence as low"
 )
 
-_INCIDENT_EXTRACTION_USER_TMPL = (
-    "Analyze and normalize this incident transcript:\n\n"
-    "{transcript_text}\n\n"
-    "Return ONLY the JSON output as specified."
-)
+_INCIDENT_EXTRACTION_SYSTEM = sys.intern(_INCIDENT_EXTRACTION_SYSTEM)
+_INCIDENT_EXTRACTION_SYSTEM_MSG = {"role": "system", "content": _INCIDENT_EXTRACTION_SYSTEM}
+
+
+def _incident_extraction_messages(transcript_text: str) -> list[dict[str, str]]:
+    user_content = (
+        f"Analyze and normalize this incident transcript:\n\n{transcript_text}\n\n"
+        "Return ONLY the JSON output as specified."
+    )
+    return [_INCIDENT_EXTRACTION_SYSTEM_MSG, {"role": "user", "content": user_content}]
 
 
 def _extract_incident_groq(transcript_text: str) -> dict[str, Any]:
     """Extract structured incident data via Groq with normalization."""
-    from llm.groq_adapter import call_groq_chat
-    import json
-
-    messages = [
-        {"role": "system", "content": _INCIDENT_EXTRACTION_SYSTEM},
-        {"role": "user", "content": _INCIDENT_EXTRACTION_USER_TMPL.format(transcript_text=transcript_text)},
-    ]
+    transcript_text = _clip_to_budget(transcript_text)
+    messages = _incident_extraction_messages(transcript_text)
     
-    t0 = time.perf_counter()
-    result = call_groq_chat(messages, temperature=0.1, max_tokens=1024)
-    latency = int((time.perf_counter() - t0) * 1000)
+    t0 = time.monotonic_ns()
+    result = call_groq_chat(
+        messages,
+        temperature=0.1,
+        max_tokens=1024,
+        timeout=_GROQ_TIMEOUT_S,
+        max_retries=_GROQ_MAX_RETRIES,
+    )
+    latency = (time.monotonic_ns() - t0) // 1_000_000
 
     content = (result.get("content") or "").strip()
     if not content:
@@ -543,13 +929,7 @@ def _extract_incident_groq(transcript_text: str) -> dict[str, Any]:
 
     # Parse JSON response
     try:
-        # Extract JSON from markdown code blocks if present
-        if "```json" in content:
-            content = re.search(r"```json\s*\n(.*?)\n```", content, re.DOTALL).group(1)
-        elif "```" in content:
-            content = re.search(r"```\s*\n(.*?)\n```", content, re.DOTALL).group(1)
-        
-        data = json.loads(content)
+        data = _parse_llm_json(content)
         
         # Validate required fields
         required = ["core_summary", "confidence"]
@@ -575,56 +955,33 @@ def _extract_incident_groq(transcript_text: str) -> dict[str, Any]:
             "latency_ms": latency,
         }
 
-    except (json.JSONDecodeError, AttributeError) as e:
-        logger.error("extract_incident_groq JSON parse failed: %s\nContent: %s", e, content[:500])
+    except json.JSONDecodeError as e:
+        logger.error("extract_incident_groq JSON parse failed: %s\nContent: %s", e, content[:_LOG_CONTENT_CHARS])
         raise ValueError(f"Invalid JSON from Groq: {e}")
 
 
 def _extract_incident_deepseek(transcript_text: str) -> dict[str, Any]:
     """Extract structured incident data via DeepSeek with normalization."""
-    import httpx
-    import json
+    if _DEEPSEEK_API_KEY is None:
+        raise _NoCredentials("deepseek")
 
-    api_key = os.getenv("DEEPSEEK_API_KEY", "").strip()
-    if not api_key:
-        raise RuntimeError("DEEPSEEK_API_KEY not set")
+    transcript_text = _clip_to_budget(transcript_text)
 
     payload = {
         "model": "deepseek-chat",
-        "messages": [
-            {"role": "system", "content": _INCIDENT_EXTRACTION_SYSTEM},
-            {"role": "user", "content": _INCIDENT_EXTRACTION_USER_TMPL.format(transcript_text=transcript_text)},
-        ],
+        "messages": _incident_extraction_messages(transcript_text),
         "temperature": 0.1,
         "max_tokens": 1024,
     }
 
-    t0 = time.perf_counter()
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.post(
-            "https://api.deepseek.com/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
-    latency = int((time.perf_counter() - t0) * 1000)
-
-    if resp.status_code != 200:
-        raise RuntimeError(f"DeepSeek HTTP {resp.status_code}: {resp.text[:300]}")
+    resp, latency = _post_deepseek("deepseek.extract_incident", payload)
 
-    body = resp.json()
+    body = _loads(resp.content)
     content = (body["choices"][0]["message"]["content"] or "").strip()
 
     # Parse JSON response
     try:
-        if "```json" in content:
-            content = re.search(r"```json\s*\n(.*?)\n```", content, re.DOTALL).group(1)
-        elif "```" in content:
-            content = re.search(r"```\s*\n(.*?)\n```", content, re.DOTALL).group(1)
-        
-        data = json.loads(content)
+        data = _parse_llm_json(content)
         
         required = ["core_summary", "confidence"]
         for field in required:
@@ -649,25 +1006,27 @@ def _extract_incident_deepseek(transcript_text: str) -> dict[str, Any]:
             "latency_ms": latency,
         }
 
-    except (json.JSONDecodeError, AttributeError) as e:
-        logger.error("extract_incident_deepseek JSON parse failed: %s", e)
+    except json.JSONDecodeError as e:
+        logger.error(
+            "extract_incident_deepseek JSON parse failed: %s\nContent: %s", e, content[:_LOG_CONTENT_CHARS]
+        )
         raise ValueError(f"Invalid JSON from DeepSeek: {e}")
 
 
 def _extract_incident_fallback(transcript_text: str) -> dict[str, Any]:
     """Fallback incident extraction using regex patterns."""
-    t0 = time.perf_counter()
+    t0 = time.monotonic_ns()
     
     # Simple segmentation at commas and periods
-    segments = re.split(r'[,\.]+', transcript_text)
-    normalized = [s.strip() for s in segments if len(s.strip()) > 5]
+    segments = (m.group().strip() for m in _SEGMENT_FINDER_RE.finditer(transcript_text))
+    normalized = [s for s in segments if len(s) > 5]
     
     # Generate basic summary from first 2 segments
     summary = ". ".join(normalized[:2]) if normalized else transcript_text[:200]
     if summary and not summary.endswith('.'):
         summary += '.'
     
-    latency = int((time.perf_counter() - t0) * 1000)
+    latency = (time.monotonic_ns() - t0) // 1_000_000
     
     logger.info("extract_incident_fallback (regex): %d statements", len(normalized))
     
@@ -685,6 +1044,10 @@ def _extract_incident_fallback(transcript_text: str) -> dict[str, Any]:
     }
 
 
+_EXTRACT_PROVIDERS = _providers(_extract_incident_groq, _extract_incident_deepseek)
+
+
+@_memoised
 def extract_normalized_incident(transcript_text: str) -> dict[str, Any]:
     """Extract and normalize mixed-language incident transcripts into structured data.
     
@@ -708,30 +1071,14 @@ def extract_normalized_incident(transcript_text: str) -> dict[str, Any]:
           "latency_ms": int,
         }
     """
-    # Try providers in priority order
-    providers = [
-        ("groq", _extract_incident_groq),
-        ("deepseek", _extract_incident_deepseek),
-    ]
-
-    for name, fn in providers:
-        try:
-            result = fn(transcript_text)
-            
-            # Validate core fields
-            if not result.get("core_summary") or len(result["core_summary"]) < 10:
-                logger.warning("extract_normalized_incident %s: invalid summary, skipping", name)
-                continue
-
-            if result.get("confidence") not in ("high", "medium", "low"):
-                logger.warning("extract_normalized_incident %s: invalid confidence, skipping", name)
-                continue
-
-            return result
-
-        except Exception as exc:
-            logger.warning("extract_normalized_incident %s failed: %s", name, exc)
-            continue
+    result = _first_valid_result(
+        "extract_normalized_incident",
+        _EXTRACT_PROVIDERS,
+        transcript_text,
+        _check_incident,
+    )
+    if result is not None:
+        return result
 
     # All LLM providers failed — use regex fallback
     return _extract_incident_fallback(transcript_text)
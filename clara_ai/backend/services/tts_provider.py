@@ -4,18 +4,44 @@ Voice resolution order:
   1. Enrolled voice (ElevenLabs) if user_name given and voice exists in registry
   2. System native TTS (pyttsx3 - uses espeak on Linux, SAPI5 on Windows, NSSpeech on macOS)
   3. Edge-tts as fallback (if system TTS fails)
+
+System TTS and ElevenLabs results are cached (provider tag "cached" on a hit).
 """
 
 from __future__ import annotations
 
+import asyncio
+import ctypes
+import hashlib
 import io
 import logging
 import os
+import random
+import re
+import subprocess
 import tempfile
-from typing import Any
+import threading
+import time
+import wave
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Mapping, TypeVar
+
+import httpx
+
+from services._http import get_async_client
 
 logger = logging.getLogger(__name__)
 
+# lameenc encodes MP3 in-process (libmp3lame); without it pydub spawns ffmpeg.
+try:
+    import lameenc  # type: ignore
+    _LAMEENC_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _LAMEENC_AVAILABLE = False
+    lameenc = None  # type: ignore
+
 # ── Language → edge-tts voice map (fallback) ─────────────────────────────────
 
 _EDGE_VOICE_MAP: dict[str, dict[str, str]] = {
@@ -37,72 +63,177 @@ DEFAULT_GENDER = "female"
 
 # ── System TTS synthesis (pyttsx3) ────────────────────────────────────────────
 
+# espeak-ng prosody, shared by the in-process and subprocess paths:
+# f4/m4 variants are smoother than f3/m3; slightly slower (default 175 wpm),
+# lower-pitched (default 50) and louder (default 100) than stock; 3 × 10 ms
+# word gap for smooth transitions; no capital-letter emphasis.
+_ESPEAK_SPEED_WPM = 155
+_ESPEAK_PITCH = 48
+_ESPEAK_AMPLITUDE = 110
+_ESPEAK_WORD_GAP = 3
+_ESPEAK_CAPITALS = 0
+
+# libespeak-ng constants (speak_lib.h)
+_AUDIO_OUTPUT_SYNCHRONOUS = 2
+# Without this option espeak_Initialize calls exit(1) when espeak-ng-data is
+# missing, taking the whole server process down with it
+_ESPEAK_INITIALIZE_DONT_EXIT = 0x8000
+_POS_CHARACTER = 1
+_espeakCHARS_UTF8 = 1
+_espeakENDPAUSE = 0x1000
+_espeakRATE, _espeakVOLUME, _espeakPITCH, _espeakCAPITALS, _espeakWORDGAP = 1, 2, 3, 6, 7
+
+_ESPEAK_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p)
+
+
+class _InProcessEspeak:
+    """libespeak-ng loaded once via ctypes, so utterances skip fork + exec + voice load.
+
+    The library keeps global state, so calls are serialised on a lock; it
+    synthesises far faster than real time, which keeps the lock cheap.
+    """
+
+    def __init__(self, lib: ctypes.CDLL, sample_rate: int) -> None:
+        self._lib = lib
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._voice: str | None = None
+        self._pcm = bytearray()
+        # Kept on the instance: ctypes must not garbage-collect the callback
+        self._callback = _ESPEAK_CALLBACK(self._on_samples)
+        lib.espeak_SetSynthCallback(self._callback)
+        for param, value in (
+            (_espeakRATE, _ESPEAK_SPEED_WPM),
+            (_espeakPITCH, _ESPEAK_PITCH),
+            (_espeakVOLUME, _ESPEAK_AMPLITUDE),
+            (_espeakWORDGAP, _ESPEAK_WORD_GAP),
+            (_espeakCAPITALS, _ESPEAK_CAPITALS),
+        ):
+            lib.espeak_SetParameter(param, value, 0)
+
+    def _on_samples(self, wav: Any, numsamples: int, events: Any) -> int:
+        if wav and numsamples > 0:
+            self._pcm += ctypes.string_at(wav, numsamples * 2)
+        return 0  # continue synthesis
+
+    def synth(self, text: str, voice: str) -> bytes:
+        """Return mono 16-bit PCM at :attr:`sample_rate` for *text*."""
+        data = text.encode("utf-8")
+        with self._lock:
+            if voice != self._voice:
+                if self._lib.espeak_SetVoiceByName(voice.encode("ascii")) != 0:
+                    raise RuntimeError(f"espeak-ng has no voice {voice!r}")
+                self._voice = voice
+            self._pcm = bytearray()
+            rc = self._lib.espeak_Synth(
+                data, len(data) + 1, 0, _POS_CHARACTER, 0, _espeakCHARS_UTF8 | _espeakENDPAUSE, None, None
+            )
+            if rc != 0:
+                raise RuntimeError(f"espeak-ng synthesis failed (code {rc})")
+            return bytes(self._pcm)
+
+
+_espeak: _InProcessEspeak | None = None
+_espeak_loaded = False
+_espeak_init_lock = threading.Lock()
+
+
+def _get_inprocess_espeak() -> _InProcessEspeak | None:
+    """Load libespeak-ng on first use; ``None`` if it is unavailable (CLI is used instead)."""
+    global _espeak, _espeak_loaded
+    if _espeak_loaded:
+        return _espeak
+    with _espeak_init_lock:
+        if not _espeak_loaded:
+            try:
+                lib = ctypes.CDLL("libespeak-ng.so.1")
+                lib.espeak_Synth.argtypes = [
+                    ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+                    ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p,
+                ]
+                lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+                # Returns the output sample rate, or 0 if espeak-ng-data is missing
+                sample_rate = lib.espeak_Initialize(
+                    _AUDIO_OUTPUT_SYNCHRONOUS, 0, None, _ESPEAK_INITIALIZE_DONT_EXIT
+                )
+                if sample_rate <= 0:
+                    raise OSError(f"espeak_Initialize returned {sample_rate}")
+                _espeak = _InProcessEspeak(lib, sample_rate)
+                logger.info("System TTS: using in-process libespeak-ng (%d Hz)", sample_rate)
+            except (OSError, AttributeError) as exc:
+                logger.info("System TTS: libespeak-ng not loadable (%s); using the espeak-ng CLI", exc)
+            _espeak_loaded = True
+    return _espeak
+
+
 def _system_tts_synthesize(text: str, language: str = DEFAULT_LANG, gender: str = DEFAULT_GENDER) -> bytes:
     """Synthesize text using espeak-ng with natural prosody settings.
     
-    Uses espeak-ng directly for better control over speech quality and natural flow.
+    Uses libespeak-ng in-process when it can be loaded, else the espeak-ng CLI.
     
     Returns MP3 bytes.
     """
-    import subprocess
-    from pydub import AudioSegment
-    
     # Ensure text has proper punctuation for natural phrasing
     if text and not text.rstrip().endswith(('.', '!', '?')):
         text = text.rstrip() + '.'
     
-    # Save to temporary WAV file
-    tmp_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    tmp_mp3 = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
-    tmp_wav.close()
-    tmp_mp3.close()
-    
-    try:
-        # Select voice based on gender - using higher quality variants
-        voice = "en-us+f4" if gender.lower() == "female" else "en-us+m4"
-        
-        # espeak-ng parameters optimized for smooth, clear speech:
-        # -v: voice selection (f4/m4 are smoother than f3/m3)
-        # -s: speed (words per minute, default 175, range 80-450)
-        # -p: pitch (0-99, default 50)
-        # -a: amplitude/volume (0-200, default 100)
-        # -g: word gap in 10ms units (default 0)
-        # -k: capital letter indication (0=none)
-        # --stdin: prevents certain artifacts
-        cmd = [
-            "espeak-ng",
-            "-v", voice,           # Higher quality voice variant (f4/m4)
-            "-s", "155",           # Slightly slower for clarity
-            "-p", "48",            # Slightly lower pitch for naturalness
-            "-a", "110",           # Slightly increased volume for clarity
-            "-g", "3",             # 3ms gap for smooth word transitions
-            "-k", "0",             # No capital emphasis
-            "-w", tmp_wav.name,    # Output to WAV
-            text
-        ]
-        
-        # Run espeak-ng
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"espeak-ng failed: {result.stderr}")
-        
-        # Convert WAV to MP3 using pydub
-        audio = AudioSegment.from_wav(tmp_wav.name)
-        audio.export(tmp_mp3.name, format="mp3", bitrate="128k")
-        
-        # Read MP3 bytes
-        with open(tmp_mp3.name, "rb") as f:
-            mp3_data = f.read()
-        
-        return mp3_data
-    finally:
-        # Cleanup
-        for path in [tmp_wav.name, tmp_mp3.name]:
-            try:
-                os.unlink(path)
-            except OSError:
-                pass
+    # Select voice based on gender - using higher quality variants
+    voice = "en-us+f4" if gender.lower() == "female" else "en-us+m4"
+
+    espeak = _get_inprocess_espeak()
+    if espeak is not None:
+        return _pcm_to_mp3(espeak.synth(text, voice), espeak.sample_rate, 1)
+
+    # --stdin: text is read from stdin, so it never has to be escaped as an argument
+    # --stdout: WAV is written to stdout, so no temp files are needed
+    cmd = [
+        "espeak-ng",
+        "-v", voice,
+        "-s", str(_ESPEAK_SPEED_WPM),
+        "-p", str(_ESPEAK_PITCH),
+        "-a", str(_ESPEAK_AMPLITUDE),
+        "-g", str(_ESPEAK_WORD_GAP),
+        "-k", str(_ESPEAK_CAPITALS),
+        "--stdin",
+        "--stdout",
+    ]
+
+    # Run espeak-ng
+    result = subprocess.run(cmd, input=text.encode("utf-8"), capture_output=True, timeout=30)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"espeak-ng failed: {result.stderr.decode(errors='replace')}")
+
+    return _wav_to_mp3(result.stdout)
+
+
+def _wav_to_mp3(wav_bytes: bytes) -> bytes:
+    """Encode WAV bytes as 128 kbps MP3 (see :func:`_pcm_to_mp3`)."""
+    # espeak-ng's streamed WAV header carries placeholder sizes; wave just
+    # reads whatever PCM follows it.
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        rate = wf.getframerate()
+        channels = wf.getnchannels()
+        pcm = wf.readframes(wf.getnframes())
+    return _pcm_to_mp3(pcm, rate, channels)
+
+
+def _pcm_to_mp3(pcm: bytes, rate: int, channels: int) -> bytes:
+    """Encode 16-bit PCM as 128 kbps MP3 — in-process via lameenc, else pydub/ffmpeg."""
+    if _LAMEENC_AVAILABLE:
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(128)
+        encoder.set_in_sample_rate(rate)
+        encoder.set_channels(channels)
+        encoder.set_quality(2)
+        return bytes(encoder.encode(pcm) + encoder.flush())
+
+    from pydub import AudioSegment
+
+    audio = AudioSegment(data=pcm, sample_width=2, frame_rate=rate, channels=channels)
+    out = io.BytesIO()
+    audio.export(out, format="mp3", bitrate="128k")
+    return out.getvalue()
 
 
 # ── Edge TTS synthesis (fallback) ─────────────────────────────────────────────
@@ -128,10 +259,8 @@ async def _edge_tts_synthesize(text: str, voice: str) -> bytes:
 
 # ── ElevenLabs enrolled-voice synthesis ───────────────────────────────────────
 
-def _elevenlabs_synthesize(text: str, voice_id: str) -> bytes:
+async def _elevenlabs_synthesize(text: str, voice_id: str) -> bytes:
     """Synthesise via ElevenLabs API (for enrolled clone voices)."""
-    import httpx
-
     api_key = os.getenv("ELEVENLABS_API_KEY", "").strip()
     if not api_key:
         raise RuntimeError("ELEVENLABS_API_KEY not set")
@@ -144,28 +273,344 @@ def _elevenlabs_synthesize(text: str, voice_id: str) -> bytes:
         "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
     }
 
-    with httpx.Client(timeout=30.0) as client:
-        resp = client.post(url, headers=headers, json=payload)
+    resp = await get_async_client().post(url, headers=headers, json=payload, timeout=30.0)
 
+    if resp.status_code >= 500:
+        # Server-side failure — raised as HTTPStatusError so _with_retry retries it
+        raise httpx.HTTPStatusError(
+            f"ElevenLabs HTTP {resp.status_code}: {resp.text[:200]}", request=resp.request, response=resp
+        )
     if resp.status_code != 200:
         raise RuntimeError(f"ElevenLabs HTTP {resp.status_code}: {resp.text[:200]}")
 
     return resp.content
 
 
+_STREAM_CHUNK_BYTES = 4096
+
+
+async def _elevenlabs_open_stream(text: str, voice_id: str) -> AsyncGenerator[bytes, None]:
+    """Start a streaming ElevenLabs synthesis and return an iterator of MP3 chunks.
+
+    The first chunk is read before returning, so HTTP and connection errors
+    surface here (where the fallback chain can handle them) rather than midway
+    through a response that has already started.
+    """
+    api_key = os.getenv("ELEVENLABS_API_KEY", "").strip()
+    if not api_key:
+        raise RuntimeError("ELEVENLABS_API_KEY not set")
+
+    client = get_async_client()
+    request = client.build_request(
+        "POST",
+        f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream",
+        headers={"xi-api-key": api_key, "Content-Type": "application/json"},
+        json={
+            "text": text,
+            "model_id": "eleven_multilingual_v2",
+            "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
+        },
+        timeout=30.0,
+    )
+    resp = await client.send(request, stream=True)
+    try:
+        if resp.status_code != 200:
+            await resp.aread()
+            msg = f"ElevenLabs HTTP {resp.status_code}: {resp.text[:200]}"
+            if resp.status_code >= 500:
+                raise httpx.HTTPStatusError(msg, request=resp.request, response=resp)
+            raise RuntimeError(msg)
+        chunks = resp.aiter_bytes(_STREAM_CHUNK_BYTES)
+        first = await anext(chunks, b"")
+    except BaseException:
+        await resp.aclose()
+        raise
+
+    async def _body() -> AsyncIterator[bytes]:
+        try:
+            if first:
+                yield first
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await resp.aclose()
+
+    return _body()
+
+
+# ── Provider health: cooldown + retry ─────────────────────────────────────────
+
+# A provider that fails transiently (timeouts, connection errors, 5xx, a hung
+# espeak-ng) is skipped for _PROVIDER_COOLDOWN_S, so a sustained outage costs
+# one timeout instead of one per request; transient ElevenLabs failures are
+# retried with jittered exponential backoff first. Errors caused by the request
+# itself (4xx, bad input) fall through to the next provider without a retry or
+# a cooldown, so one user's bad request never disables a provider for everyone.
+_PROVIDER_COOLDOWN_S = 30.0
+_RETRY_ATTEMPTS = 2
+_RETRY_BACKOFF_INITIAL_S = 0.1
+_RETRY_BACKOFF_MAX_S = 1.0
+
+
+class _Provider:
+    """Cooldown state for one TTS backend in the fallback chain."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.cooldown_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.cooldown_until
+
+    def mark_failed(self) -> None:
+        self.cooldown_until = time.monotonic() + _PROVIDER_COOLDOWN_S
+        logger.warning("TTS provider %s cooling down for %.0fs", self.name, _PROVIDER_COOLDOWN_S)
+
+
+# Edge TTS is the last resort and is always attempted, so it has no entry here.
+_PROVIDERS: dict[str, _Provider] = {
+    "elevenlabs_clone": _Provider("elevenlabs_clone"),
+    "system_tts": _Provider("system_tts"),
+}
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, (httpx.TransportError, subprocess.TimeoutExpired)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+
+_T = TypeVar("_T")
+
+
+async def _with_retry(call: Callable[[], Awaitable[_T]]) -> _T:
+    """Await *call*, retrying transient failures up to ``_RETRY_ATTEMPTS`` times in total."""
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return await call()
+        except Exception as exc:
+            if attempt + 1 >= _RETRY_ATTEMPTS or not _is_transient(exc):
+                raise
+            delay = min(
+                _RETRY_BACKOFF_MAX_S,
+                _RETRY_BACKOFF_INITIAL_S * 2**attempt + random.uniform(0, _RETRY_BACKOFF_INITIAL_S),
+            )
+            logger.info("TTS call failed transiently (%s); retrying in %.2fs", exc, delay)
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+# ── Synthesis caches ──────────────────────────────────────────────────────────
+
+# Synthesis is deterministic per (text, voice), so repeated prompts and greetings
+# are served from cache: system TTS from an in-process LRU, ElevenLabs clones
+# from content-addressed MP3 files on disk (this also saves API spend).
+_SYSTEM_TTS_CACHE: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+_SYSTEM_TTS_CACHE_MAX = 512
+_SYSTEM_TTS_CACHE_LOCK = threading.Lock()
+
+TTS_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "tts_cache"
+# The disk cache is bounded: files unused for _TTS_CACHE_MAX_AGE_S are dropped,
+# then the least recently used until the directory fits _TTS_CACHE_MAX_BYTES.
+# A hit refreshes the file's mtime, so mtime order is LRU order.
+_TTS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_TTS_CACHE_MAX_AGE_S = 30 * 24 * 3600
+
+
+def _system_tts_cache_get(key: tuple[str, str, str]) -> bytes | None:
+    with _SYSTEM_TTS_CACHE_LOCK:
+        audio = _SYSTEM_TTS_CACHE.get(key)
+        if audio is not None:
+            _SYSTEM_TTS_CACHE.move_to_end(key)
+        return audio
+
+
+def _system_tts_cache_put(key: tuple[str, str, str], audio: bytes) -> None:
+    with _SYSTEM_TTS_CACHE_LOCK:
+        _SYSTEM_TTS_CACHE[key] = audio
+        _SYSTEM_TTS_CACHE.move_to_end(key)
+        while len(_SYSTEM_TTS_CACHE) > _SYSTEM_TTS_CACHE_MAX:
+            _SYSTEM_TTS_CACHE.popitem(last=False)
+
+
+def _elevenlabs_cache_path(voice_id: str, text: str) -> Path:
+    digest = hashlib.sha256(f"{voice_id}\0{text}".encode("utf-8")).hexdigest()
+    return TTS_CACHE_DIR / f"{digest}.mp3"
+
+
+def _elevenlabs_cache_load(path: Path) -> bytes | None:
+    """Return the cached MP3 at *path* (refreshing its mtime), or None on a miss.
+
+    Blocking file I/O — call via ``asyncio.to_thread``.
+    """
+    try:
+        audio = path.read_bytes()
+        os.utime(path)
+    except OSError:
+        return None
+    return audio
+
+
+def _elevenlabs_cache_store(path: Path, audio: bytes) -> None:
+    """Write *audio* to *path* via a temp file + rename, then prune the cache
+    directory; failures are only logged.
+
+    Blocking file I/O — call via ``asyncio.to_thread``.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp.write(audio)
+        os.replace(tmp.name, path)
+    except OSError as exc:
+        logger.warning("Could not cache ElevenLabs audio at %s: %s", path, exc)
+        return
+    _prune_tts_cache(path.parent)
+
+
+def _prune_tts_cache(directory: Path) -> None:
+    """Drop expired files, then the oldest, until *directory* fits the size cap."""
+    cutoff = time.time() - _TTS_CACHE_MAX_AGE_S
+    entries: list[tuple[float, int, str]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue  # removed concurrently
+                if entry.is_file():
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError as exc:
+        logger.warning("Could not scan TTS cache %s: %s", directory, exc)
+        return
+
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for mtime, size, file in entries:
+        if mtime >= cutoff and total <= _TTS_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(file)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Could not evict %s from TTS cache: %s", file, exc)
+            continue
+        total -= size
+
+
+async def _tee_to_cache(chunks: AsyncGenerator[bytes, None], path: Path) -> AsyncIterator[bytes]:
+    """Yield *chunks* unchanged; once fully consumed, store the whole MP3 at *path*.
+
+    If the consumer stops early (client disconnect), *chunks* is closed so the
+    upstream response is released; a partial MP3 is never cached.
+    """
+    parts: list[bytes] = []
+    try:
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+    finally:
+        await chunks.aclose()
+    await asyncio.to_thread(_elevenlabs_cache_store, path, b"".join(parts))
+
+
+# ── Sentence chunking ─────────────────────────────────────────────────────────
+
+# Edge TTS is a network service that synthesises requests independently, so a
+# long text is sent as sentence chunks in parallel and latency tracks the
+# slowest chunk rather than the whole text. Chunks only ever end at a sentence
+# end: each chunk keeps its own punctuation and intonation, and the encoder
+# padding between concatenated MP3s falls inside the pause that follows a
+# sentence anyway. The other providers are not chunked — espeak-ng is
+# serialised on one lock, and a clone voice would lose prosody across chunks
+# while multiplying API requests and quota.
+_CHUNK_MIN_CHARS = 60
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_sentences(text: str, lo: int = _CHUNK_MIN_CHARS) -> list[str]:
+    """Split *text* into synthesis chunks at sentence ends.
+
+    Sentences shorter than *lo* are merged with their neighbour; a sentence is
+    never split internally, however long.
+    """
+    merged: list[str] = []
+    for sentence in _SENTENCE_END_RE.split(" ".join(text.split())):
+        if merged and len(merged[-1]) < lo:
+            merged[-1] = f"{merged[-1]} {sentence}"
+        else:
+            merged.append(sentence)
+    if len(merged) > 1 and len(merged[-1]) < lo:
+        tail = merged.pop()
+        merged[-1] = f"{merged[-1]} {tail}"
+    return merged
+
+
+async def _synthesize_chunked(synth: Callable[[str], Awaitable[bytes]], text: str) -> bytes:
+    """Run *synth* over the sentence chunks of *text* concurrently; join the MP3s.
+
+    If any chunk fails, the remaining chunks are cancelled and its error is raised.
+    """
+    chunks = _split_sentences(text)
+    if len(chunks) <= 1:
+        return await synth(text)
+    tasks = [asyncio.ensure_future(synth(chunk)) for chunk in chunks]
+    try:
+        parts = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return b"".join(parts)
+
+
+# ── Silence ───────────────────────────────────────────────────────────────────
+
+# ~100 ms of silence returned for empty/whitespace text instead of spawning a
+# synthesiser or spending API quota. Four MPEG-1 Layer III frames (128 kbps,
+# 44.1 kHz, mono, 1152 samples / 417 bytes each); all-zero side info and main
+# data decode as digital silence.
+_SILENT_MP3 = (b"\xff\xfb\x90\xc0" + bytes(413)) * 4
+
+
 # ── Voice resolution ──────────────────────────────────────────────────────────
 
+def _build_voice_table() -> Mapping[tuple[str, str], str]:
+    """Flatten _EDGE_VOICE_MAP into lowercase (lang, gender) → voice, adding
+    each region's base language unless the map defines it explicitly."""
+    table: dict[tuple[str, str], str] = {}
+    for lang, voices in _EDGE_VOICE_MAP.items():
+        for gen, voice in voices.items():
+            table[(lang.lower(), gen)] = voice
+    for lang, voices in _EDGE_VOICE_MAP.items():
+        for gen, voice in voices.items():
+            table.setdefault((lang.lower().split("-")[0], gen), voice)
+    return MappingProxyType(table)
+
+
+_VOICE_TABLE = _build_voice_table()
+
+
 def _resolve_edge_voice(language: str = DEFAULT_LANG, gender: str = DEFAULT_GENDER) -> str:
     """Return the edge-tts voice name for the given language + gender."""
     lang = language.lower().strip()
     gen = gender.lower().strip()
 
-    voices = _EDGE_VOICE_MAP.get(lang) or _EDGE_VOICE_MAP.get(lang.split("-")[0])
-    if voices is None:
-        voices = _EDGE_VOICE_MAP[DEFAULT_LANG]
-        logger.warning("No edge-tts voice for lang=%s, falling back to %s", language, DEFAULT_LANG)
+    voice = _VOICE_TABLE.get((lang, gen))
+    if voice is not None:
+        return voice
 
-    voice = voices.get(gen, voices.get(DEFAULT_GENDER, list(voices.values())[0]))
+    # Slow path: unknown gender, unlisted region, or unsupported language
+    if (DEFAULT_LANG, gen) not in _VOICE_TABLE:
+        gen = DEFAULT_GENDER
+    voice = _VOICE_TABLE.get((lang, gen)) or _VOICE_TABLE.get((lang.split("-")[0], gen))
+    if voice is None:
+        logger.warning("No edge-tts voice for lang=%s, falling back to %s", language, DEFAULT_LANG)
+        voice = _VOICE_TABLE[(DEFAULT_LANG, gen)]
     return voice
 
 
@@ -177,6 +622,7 @@ async def synthesize_speech(
     user_name: str | None = None,
     language: str = DEFAULT_LANG,
     gender: str = DEFAULT_GENDER,
+    stream: bool = False,
 ) -> dict[str, Any]:
     """Synthesize *text* to MP3 audio bytes.
 
@@ -185,13 +631,28 @@ async def synthesize_speech(
       2. System native TTS (pyttsx3)
       3. Edge-tts as fallback (if system TTS fails)
 
+    A provider that fails transiently is skipped for ``_PROVIDER_COOLDOWN_S``
+    seconds; a request-specific error (4xx, bad input) only falls back.
+    Multi-sentence text sent to edge-tts is synthesised as parallel sentence
+    chunks.
+
+    With ``stream=True`` an uncached enrolled-voice synthesis uses the ElevenLabs
+    streaming endpoint: ``"audio"`` is then ``None`` and ``"audio_stream"`` yields
+    MP3 chunks as they arrive. Every other path returns complete bytes.
+
+    Empty or whitespace-only text returns a short silent MP3 without touching
+    any provider (``voice_provider`` ``"none"``).
+
     Returns::
         {
           "audio": bytes,           # MP3 data
-          "voice_provider": str,    # "elevenlabs_clone" | "system_tts" | "edge_tts"
+          "voice_provider": str,    # "elevenlabs_clone" | "system_tts" | "edge_tts" | "cached" | "none"
           "voice_name": str,        # voice identifier used
         }
     """
+    if not text or text.isspace():
+        return {"audio": _SILENT_MP3, "voice_provider": "none", "voice_name": "silence"}
+
     # 1. Try enrolled clone voice
     if user_name:
         try:
@@ -199,33 +660,77 @@ async def synthesize_speech(
             registry = load_voice_registry()
             voice_id = registry.get(user_name.lower())
             if voice_id:
-                logger.info("Using enrolled voice for %s (id=%s)", user_name, voice_id)
-                audio = _elevenlabs_synthesize(text, voice_id)
-                return {
-                    "audio": audio,
-                    "voice_provider": "elevenlabs_clone",
-                    "voice_name": f"{user_name}/{voice_id}",
-                }
+                cache_path = _elevenlabs_cache_path(voice_id, text)
+                cached_audio = await asyncio.to_thread(_elevenlabs_cache_load, cache_path)
+                if cached_audio is not None:
+                    logger.info("Using cached enrolled voice audio for %s (id=%s)", user_name, voice_id)
+                    return {
+                        "audio": cached_audio,
+                        "voice_provider": "cached",
+                        "voice_name": f"{user_name}/{voice_id}",
+                    }
+                clone = _PROVIDERS["elevenlabs_clone"]
+                if not clone.healthy:
+                    logger.info("ElevenLabs cooling down — skipping enrolled voice for %s", user_name)
+                else:
+                    logger.info("Using enrolled voice for %s (id=%s, stream=%s)", user_name, voice_id, stream)
+                    try:
+                        if stream:
+                            chunks = await _with_retry(lambda: _elevenlabs_open_stream(text, voice_id))
+                        else:
+                            audio = await _with_retry(lambda: _elevenlabs_synthesize(text, voice_id))
+                    except Exception as exc:
+                        if _is_transient(exc):
+                            clone.mark_failed()
+                        raise
+                    if stream:
+                        return {
+                            "audio": None,
+                            "audio_stream": _tee_to_cache(chunks, cache_path),
+                            "voice_provider": "elevenlabs_clone",
+                            "voice_name": f"{user_name}/{voice_id}",
+                        }
+                    await asyncio.to_thread(_elevenlabs_cache_store, cache_path, audio)
+                    return {
+                        "audio": audio,
+                        "voice_provider": "elevenlabs_clone",
+                        "voice_name": f"{user_name}/{voice_id}",
+                    }
         except Exception as exc:
             logger.warning("Enrolled voice failed for %s: %s — falling back to system TTS", user_name, exc)
 
     # 2. System TTS (primary)
-    try:
-        logger.info("Using system TTS (lang=%s, gender=%s)", language, gender)
-        audio = _system_tts_synthesize(text, language, gender)
+    cache_key = (text, language, gender)
+    cached = _system_tts_cache_get(cache_key)
+    if cached is not None:
         return {
-            "audio": audio,
-            "voice_provider": "system_tts",
+            "audio": cached,
+            "voice_provider": "cached",
             "voice_name": f"system/{language}/{gender}",
         }
-    except Exception as exc:
-        logger.warning("System TTS failed: %s — failing back to edge-tts", exc)
-    
+    system = _PROVIDERS["system_tts"]
+    if not system.healthy:
+        logger.info("System TTS cooling down — using edge-tts")
+    else:
+        try:
+            logger.info("Using system TTS (lang=%s, gender=%s)", language, gender)
+            audio = await asyncio.to_thread(_system_tts_synthesize, text, language, gender)
+            _system_tts_cache_put(cache_key, audio)
+            return {
+                "audio": audio,
+                "voice_provider": "system_tts",
+                "voice_name": f"system/{language}/{gender}",
+            }
+        except Exception as exc:
+            if _is_transient(exc):
+                system.mark_failed()
+            logger.warning("System TTS failed: %s — failing back to edge-tts", exc)
+
     # 3. Edge TTS (fallback)
     try:
         voice_name = _resolve_edge_voice(language, gender)
         logger.info("Using edge-tts fallback voice=%s (lang=%s, gender=%s)", voice_name, language, gender)
-        audio = await _edge_tts_synthesize(text, voice_name)
+        audio = await _synthesize_chunked(lambda chunk: _edge_tts_synthesize(chunk, voice_name), text)
         return {
             "audio": audio,
             "voice_provider": "edge_tts",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import json
 import logging
@@ -11,7 +12,9 @@ import wave
 from pathlib import Path
 from typing import Any
 
-import requests
+import httpx
+
+from services._http import get_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,34 +25,75 @@ VOICES_JSON_PATH = Path(__file__).resolve().parent.parent / "data" / "voices.jso
 VOICES_GENDER_JSON_PATH = Path(__file__).resolve().parent.parent / "data" / "voices_gender.json"
 _REQUEST_TIMEOUT = 20  # seconds
 
+# orjson (optional) parses and serialises the registries in C; stdlib json is
+# the drop-in fallback with the same indented, UTF-8 output.
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # ── Registry helpers ──────────────────────────────────────────────────────────
 
 
+# Parsed registries keyed by file (mtime, size), so unchanged files skip the
+# read + parse; size guards against filesystems with coarse mtime resolution
+_voice_registry_cache: tuple[tuple[int, int], dict[str, str]] | None = None
+_gender_registry_cache: tuple[tuple[int, int], dict[str, str]] | None = None
+
+
 def load_voice_registry() -> dict[str, str]:
     """Return the user_name → voice_id mapping from voices.json.
 
-    Returns an empty dict if the file does not exist or is corrupted.
+    Returns an empty dict if the file does not exist or is corrupted. The
+    parsed dict is cached until the file changes — treat it as read-only.
     """
-    if not VOICES_JSON_PATH.exists():
+    global _voice_registry_cache
+    try:
+        st = VOICES_JSON_PATH.stat()
+    except FileNotFoundError:
         return {}
+    except OSError as exc:
+        logger.error("Failed to read voices.json: %s", exc)
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    if _voice_registry_cache is not None and _voice_registry_cache[0] == key:
+        return _voice_registry_cache[1]
     try:
-        with VOICES_JSON_PATH.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = _loads(VOICES_JSON_PATH.read_bytes())
         if not isinstance(data, dict):
             logger.warning("voices.json contained non-dict data; resetting registry.")
             return {}
+        _voice_registry_cache = (key, data)
         return data
     except (json.JSONDecodeError, OSError) as exc:
         logger.error("Failed to read voices.json: %s", exc)
         return {}
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling ``.tmp`` file and rename it over *path*.
+
+    ``os.replace`` is atomic, so readers see either the old or the new
+    registry — never a half-written file after a crash mid-write.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 def save_voice_registry(registry: dict[str, str]) -> None:
     """Persist the user_name → voice_id mapping to voices.json."""
     VOICES_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with VOICES_JSON_PATH.open("w", encoding="utf-8") as fh:
-            json.dump(registry, fh, indent=2, ensure_ascii=False)
+        _write_atomic(VOICES_JSON_PATH, _dumps(registry))
     except OSError as exc:
         logger.error("Failed to write voices.json: %s", exc)
         raise
@@ -79,7 +123,7 @@ def _auth_headers(extra: dict[str, str] | None = None) -> dict[str, str]:
 # ── Public API ────────────────────────────────────────────────────────────────
 
 
-def create_voice(user_name: str, audio_bytes: bytes, filename: str = "sample.wav") -> str:
+async def create_voice(user_name: str, audio_bytes: bytes, filename: str = "sample.wav") -> str:
     """Upload *audio_bytes* to ElevenLabs and return the assigned voice_id.
 
     Args:
@@ -100,18 +144,18 @@ def create_voice(user_name: str, audio_bytes: bytes, filename: str = "sample.wav
     data = {"name": user_name}
 
     try:
-        response = requests.post(
+        response = await get_async_client().post(
             url,
             headers=_auth_headers(),
             files=files,
             data=data,
             timeout=_REQUEST_TIMEOUT,
         )
-    except requests.exceptions.RequestException as exc:
+    except httpx.HTTPError as exc:
         logger.error("ElevenLabs create_voice network error: %s", exc)
         raise RuntimeError(f"Network error contacting ElevenLabs: {exc}") from exc
 
-    if not response.ok:
+    if not response.is_success:
         _raise_api_error("create_voice", response)
 
     payload = response.json()
@@ -122,7 +166,7 @@ def create_voice(user_name: str, audio_bytes: bytes, filename: str = "sample.wav
     return voice_id
 
 
-def synthesize_voice(text: str, voice_id: str) -> bytes:
+async def synthesize_voice(text: str, voice_id: str) -> bytes:
     """Convert *text* to speech using the ElevenLabs voice identified by *voice_id*.
 
     Args:
@@ -146,17 +190,17 @@ def synthesize_voice(text: str, voice_id: str) -> bytes:
     }
 
     try:
-        response = requests.post(
+        response = await get_async_client().post(
             url,
             headers=_auth_headers({"Accept": "audio/mpeg", "Content-Type": "application/json"}),
             json=payload,
             timeout=_REQUEST_TIMEOUT,
         )
-    except requests.exceptions.RequestException as exc:
+    except httpx.HTTPError as exc:
         logger.error("ElevenLabs synthesize_voice network error: %s", exc)
         raise RuntimeError(f"Network error contacting ElevenLabs: {exc}") from exc
 
-    if not response.ok:
+    if not response.is_success:
         _raise_api_error("synthesize_voice", response)
 
     return response.content
@@ -165,7 +209,7 @@ def synthesize_voice(text: str, voice_id: str) -> bytes:
 # ── Internal ──────────────────────────────────────────────────────────────────
 
 
-def _raise_api_error(operation: str, response: requests.Response) -> None:
+def _raise_api_error(operation: str, response: httpx.Response) -> None:
     try:
         detail = response.json()
     except Exception:
@@ -179,13 +223,27 @@ def _raise_api_error(operation: str, response: requests.Response) -> None:
 
 
 def load_gender_registry() -> dict[str, str]:
-    """Return user_name → 'male'|'female' mapping from voices_gender.json."""
-    if not VOICES_GENDER_JSON_PATH.exists():
+    """Return user_name → 'male'|'female' mapping from voices_gender.json.
+
+    Cached until the file changes, like :func:`load_voice_registry` — treat as read-only.
+    """
+    global _gender_registry_cache
+    try:
+        st = VOICES_GENDER_JSON_PATH.stat()
+    except FileNotFoundError:
         return {}
+    except OSError as exc:
+        logger.error("Failed to read voices_gender.json: %s", exc)
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    if _gender_registry_cache is not None and _gender_registry_cache[0] == key:
+        return _gender_registry_cache[1]
     try:
-        with VOICES_GENDER_JSON_PATH.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        return data if isinstance(data, dict) else {}
+        data = _loads(VOICES_GENDER_JSON_PATH.read_bytes())
+        if not isinstance(data, dict):
+            return {}
+        _gender_registry_cache = (key, data)
+        return data
     except (json.JSONDecodeError, OSError) as exc:
         logger.error("Failed to read voices_gender.json: %s", exc)
         return {}
@@ -193,14 +251,26 @@ def load_gender_registry() -> dict[str, str]:
 
 def save_gender_registry(registry: dict[str, str]) -> None:
     VOICES_GENDER_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with VOICES_GENDER_JSON_PATH.open("w", encoding="utf-8") as fh:
-        json.dump(registry, fh, indent=2, ensure_ascii=False)
+    _write_atomic(VOICES_GENDER_JSON_PATH, _dumps(registry))
 
 
 # ── Gender detection from PCM audio ──────────────────────────────────────────
 
+_PITCH_RATE = 8000  # Hz; audio above this is decimated before the pitch search
+_BAND_LO_HZ = 70.0
+_BAND_HI_HZ = 400.0
+
+
+async def detect_gender_from_audio(audio_bytes: bytes, suffix: str = ".wav") -> str:
+    """Estimate speaker gender from fundamental pitch without blocking the event loop.
+
+    The WAV parse and autocorrelation run in a worker thread; see
+    :func:`_detect_gender_sync` for the method and thresholds.
+    """
+    return await asyncio.to_thread(_detect_gender_sync, audio_bytes, suffix)
+
 
-def detect_gender_from_audio(audio_bytes: bytes, suffix: str = ".wav") -> str:
+def _detect_gender_sync(audio_bytes: bytes, suffix: str = ".wav") -> str:
     """Estimate speaker gender from fundamental pitch.
 
     Uses autocorrelation on raw PCM samples (numpy required — available via Whisper).
@@ -213,49 +283,70 @@ def detect_gender_from_audio(audio_bytes: bytes, suffix: str = ".wav") -> str:
     try:
         import numpy as np  # guaranteed present (whisper dependency)
 
-        # Convert non-wav formats via the asr_service helper
         fmt = suffix.lstrip(".").lower()
-        if fmt in ("webm", "ogg", "mp3", "m4a"):
-            from services.asr_service import _prepare_bytes
-            audio_bytes, _ = _prepare_bytes(audio_bytes, fmt)
-
-        # Parse WAV
-        with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
-            framerate: int = wf.getframerate()
-            nchannels: int = wf.getnchannels()
-            sampwidth: int = wf.getsampwidth()
-            nframes = min(wf.getnframes(), int(framerate * 3))  # up to 3 s
-            raw = wf.readframes(nframes)
-
-        if sampwidth == 2:
-            samples = np.frombuffer(raw, dtype="<i2").astype(float)
-        elif sampwidth == 4:
-            samples = np.frombuffer(raw, dtype="<i4").astype(float)
+        if fmt != "wav":
+            # ffmpeg decodes other formats straight to mono PCM at the pitch
+            # rate — no intermediate WAV to re-parse
+            from services.asr_service import _prepare_pcm
+            pcm, framerate = _prepare_pcm(audio_bytes, fmt, _PITCH_RATE, max_seconds=3)
+            samples = pcm.astype(float)
         else:
-            logger.warning("detect_gender: unsupported sample width %d", sampwidth)
-            return "female"
-
-        if nchannels > 1:
-            samples = samples.reshape(-1, nchannels).mean(axis=1)
+            # Parse WAV
+            with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+                framerate = wf.getframerate()
+                nchannels: int = wf.getnchannels()
+                sampwidth: int = wf.getsampwidth()
+                nframes = min(wf.getnframes(), int(framerate * 3))  # up to 3 s
+                raw = wf.readframes(nframes)
+
+            if sampwidth == 2:
+                samples = np.frombuffer(raw, dtype="<i2").astype(float)
+            elif sampwidth == 4:
+                samples = np.frombuffer(raw, dtype="<i4").astype(float)
+            else:
+                logger.warning("detect_gender: unsupported sample width %d", sampwidth)
+                return "female"
+
+            if nchannels > 1:
+                samples = samples.reshape(-1, nchannels).mean(axis=1)
 
         mx = float(np.max(np.abs(samples)))
         if mx < 50:  # near-silence
             logger.info("detect_gender: near-silence, defaulting to female")
             return "female"
-        samples = samples / mx
+        samples *= 1.0 / mx
+
+        window = samples[: min(int(framerate * 0.2), len(samples))]  # 200 ms window
+
+        # 8 kHz is ample for a 70–350 Hz pitch search: average blocks of q
+        # samples (cheap anti-alias) and decimate, shrinking the FFT q-fold
+        q = framerate // _PITCH_RATE
+        if q > 1:
+            window = window[: len(window) // q * q].reshape(-1, q).mean(axis=1)
+            framerate //= q
 
         # Autocorrelation in voiced-pitch range [70 – 350 Hz]
         min_lag = max(1, int(framerate / 350))
         max_lag = int(framerate / 70)
-        window = samples[: min(int(framerate * 0.2), len(samples))]  # 200 ms window
 
-        corr = np.correlate(window, window, mode="full")
-        corr = corr[len(corr) // 2 :]  # keep positive-lag half
-
-        ub = min(max_lag, len(corr) - 1)
+        n = len(window)
+        ub = min(max_lag, n - 1)
         if ub <= min_lag:
             return "female"
 
+        # FFT autocorrelation (O(N log N)). Only lags up to ub are searched, and
+        # circular wrap-around first reaches lag k once nfft < n + k, so
+        # padding to n + ub (not 2N-1) keeps the searched lags wrap-free at about
+        # half the transform size
+        nfft = 1 << (n + ub - 1).bit_length()
+        spectrum = np.fft.rfft(window, nfft)
+        power = (spectrum * np.conj(spectrum)).real
+        # Band-pass 70–400 Hz in the frequency domain: drops DC and formant
+        # energy so the fundamental dominates the autocorrelation peak
+        freqs = np.fft.rfftfreq(nfft, 1.0 / framerate)
+        power[(freqs < _BAND_LO_HZ) | (freqs > _BAND_HI_HZ)] = 0.0
+        corr = np.fft.irfft(power, nfft)
+
         peak_lag = int(np.argmax(corr[min_lag : ub + 1])) + min_lag
         pitch = framerate / peak_lag if peak_lag > 0 else 0.0
         logger.info("detect_gender: pitch=%.1f Hz  lag=%d  → %s", pitch, peak_lag, "male" if pitch < 165.0 else "female")
@@ -3,22 +3,35 @@
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from services.report_summarizer import extract_normalized_incident
 
+CODESWITCHING_TRANSCRIPT = "phone la battery drain aaguthu, mic work aagula, step up transformer short circuit aaduchi"
 
-def test_tamil_english_codeswitching():
-    """Test Tamil + English code-switching normalization."""
+MULTILINGUAL_TRANSCRIPT = (
+    "server la continuously CPU usage 95% ku mela poguthu, "
+    "database connection pool exhaust aaiduchi, "
+    "log files la out of memory error varuthu, "
+    "service restart panna kooda same issue"
+)
+
+ENGLISH_TRANSCRIPT = (
+    "The production server is experiencing intermittent connection timeouts, "
+    "API response times have increased to 5+ seconds, "
+    "clients are reporting HTTP 503 errors during peak hours"
+)
+
+SINGLE_STATEMENT_TRANSCRIPT = "wifi router completely down, no connectivity"
+
+
+def _show_codeswitching(result):
     print("=" * 70)
     print("TEST 1: Tamil-English Code-Switching")
     print("=" * 70)
     
-    transcript = "phone la battery drain aaguthu, mic work aagula, step up transformer short circuit aaduchi"
-    
-    print(f"\nInput Transcript:\n{transcript}\n")
+    print(f"\nInput Transcript:\n{CODESWITCHING_TRANSCRIPT}\n")
     print("Processing with LLM normalization...")
     
-    result = extract_normalized_incident(transcript)
-    
     print(f"\n✓ Extraction completed ({result['provider']} - {result['latency_ms']}ms)\n")
     print("STRUCTURED OUTPUT:")
     print("-" * 70)
@@ -36,46 +49,27 @@ def test_tamil_english_codeswitching():
     print()
 
 
-def test_complex_multilingual():
-    """Test complex multi-issue scenario with mixed language."""
+def _show_multilingual(result):
     print("=" * 70)
     print("TEST 2: Complex Multi-Issue Scenario")
     print("=" * 70)
     
-    transcript = (
-        "server la continuously CPU usage 95% ku mela poguthu, "
-        "database connection pool exhaust aaiduchi, "
-        "log files la out of memory error varuthu, "
-        "service restart panna kooda same issue"
-    )
-    
-    print(f"\nInput Transcript:\n{transcript}\n")
+    print(f"\nInput Transcript:\n{MULTILINGUAL_TRANSCRIPT}\n")
     print("Processing...")
     
-    result = extract_normalized_incident(transcript)
-    
     print(f"\n✓ Extraction completed ({result['provider']} - {result['latency_ms']}ms)\n")
     print(json.dumps(result, indent=2, ensure_ascii=False))
     print()
 
 
-def test_english_only():
-    """Test pure English input."""
+def _show_english(result):
     print("=" * 70)
     print("TEST 3: Pure English Input")
     print("=" * 70)
     
-    transcript = (
-        "The production server is experiencing intermittent connection timeouts, "
-        "API response times have increased to 5+ seconds, "
-        "clients are reporting HTTP 503 errors during peak hours"
-    )
-    
-    print(f"\nInput Transcript:\n{transcript}\n")
+    print(f"\nInput Transcript:\n{ENGLISH_TRANSCRIPT}\n")
     print("Processing...")
     
-    result = extract_normalized_incident(transcript)
-    
     print(f"\n✓ Extraction completed ({result['provider']} - {result['latency_ms']}ms)\n")
     print("Core Summary:")
     print(result['core_summary'])
@@ -83,45 +77,66 @@ def test_english_only():
     print()
 
 
-def test_single_statement():
-    """Test single statement extraction."""
+def _show_single_statement(result):
     print("=" * 70)
     print("TEST 4: Single Statement")
     print("=" * 70)
     
-    transcript = "wifi router completely down, no connectivity"
-    
-    print(f"\nInput: {transcript}\n")
-    
-    result = extract_normalized_incident(transcript)
+    print(f"\nInput: {SINGLE_STATEMENT_TRANSCRIPT}\n")
     
     print(f"✓ Provider: {result['provider']}")
     print(f"✓ Summary: {result['core_summary']}")
     print(f"✓ Confidence: {result['confidence']}\n")
 
 
+# (transcript, printer) per test; main() runs the LLM calls concurrently
+CASES = [
+    (CODESWITCHING_TRANSCRIPT, _show_codeswitching),
+    (MULTILINGUAL_TRANSCRIPT, _show_multilingual),
+    (ENGLISH_TRANSCRIPT, _show_english),
+    (SINGLE_STATEMENT_TRANSCRIPT, _show_single_statement),
+]
+
+
+def test_tamil_english_codeswitching():
+    """Test Tamil + English code-switching normalization."""
+    _show_codeswitching(extract_normalized_incident(CODESWITCHING_TRANSCRIPT))
+
+
+def test_complex_multilingual():
+    """Test complex multi-issue scenario with mixed language."""
+    _show_multilingual(extract_normalized_incident(MULTILINGUAL_TRANSCRIPT))
+
+
+def test_english_only():
+    """Test pure English input."""
+    _show_english(extract_normalized_incident(ENGLISH_TRANSCRIPT))
+
+
+def test_single_statement():
+    """Test single statement extraction."""
+    _show_single_statement(extract_normalized_incident(SINGLE_STATEMENT_TRANSCRIPT))
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 70)
     print("INCIDENT EXTRACTION & NORMALIZATION TEST SUITE")
     print("=" * 70 + "\n")
     
-    tests = [
-        test_tamil_english_codeswitching,
-        test_complex_multilingual,
-        test_english_only,
-        test_single_statement,
-    ]
-    
-    for test_fn in tests:
-        try:
-            test_fn()
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Tests interrupted by user")
-            sys.exit(1)
-        except Exception as e:
-            print(f"\n❌ Test failed: {e}\n")
-            continue
+    # All extractions are in flight at once (wall time ≈ the slowest LLM
+    # round trip); results are printed in order as each one completes
+    with ThreadPoolExecutor(max_workers=len(CASES)) as pool:
+        futures = [pool.submit(extract_normalized_incident, transcript) for transcript, _ in CASES]
+        for future, (_, show) in zip(futures, CASES):
+            try:
+                show(future.result())
+            except KeyboardInterrupt:
+                print("\n\n⚠️  Tests interrupted by user")
+                sys.exit(1)
+            except Exception as e:
+                print(f"\n❌ Test failed: {e}\n")
+                continue
     
     print("=" * 70)
     print("ALL TESTS COMPLETED")
@@ -5,8 +5,13 @@ Run:
     source env/bin/activate
     pytest test_integration.py -v
 
+    # or in parallel — tests are network-bound, so workers overlap server latency
+    pytest -n 4 test_integration.py
+
 Requirements:
-    pip install pytest requests
+    pip install pytest httpx
+    pip install numpy          # optional, faster test-audio synthesis
+    pip install pytest-xdist   # optional, for -n
 
 The server must be running at http://127.0.0.1:8000 before running tests:
     uvicorn main:app --host 0.0.0.0 --port 8000
@@ -14,13 +19,22 @@ The server must be running at http://127.0.0.1:8000 before running tests:
 
 from __future__ import annotations
 
-import math
-import struct
-import wave
-from io import BytesIO
-
+import asyncio
+import atexit
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
 import pytest
-import requests
+
+# The synthetic WAV factory lives with the sample-file generator in tests/
+sys.path.insert(0, str(Path(__file__).parent / "tests"))
+from make_sample_wav import make_wav_bytes  # noqa: E402
 
 # ── Config ─────────────────────────────────────────────────────────────────────
 
@@ -29,29 +43,22 @@ TIMEOUT = 20
 
 # ── HTTP helpers ───────────────────────────────────────────────────────────────
 
-
-def _get(path: str, **kwargs) -> requests.Response:
-    return requests.get(f"{BASE_URL}{path}", timeout=TIMEOUT, **kwargs)
+# One keep-alive client for the whole run: requests reuse pooled connections
+# instead of opening a new TCP connection each time.
+_CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+)
+atexit.register(_CLIENT.close)
 
 
-def _post(path: str, **kwargs) -> requests.Response:
-    return requests.post(f"{BASE_URL}{path}", timeout=TIMEOUT, **kwargs)
+def _get(path: str, **kwargs) -> httpx.Response:
+    return _CLIENT.get(path, **kwargs)
 
 
-# ── Synthetic WAV factory ──────────────────────────────────────────────────────
-
-
-def _make_wav(duration_s: int = 1, frequency: float = 440.0, sample_rate: int = 16_000) -> bytes:
-    """Return raw WAV bytes: sine wave, 16-bit mono."""
-    buf = BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        for i in range(sample_rate * duration_s):
-            value = int(32_767 * math.sin(2 * math.pi * frequency * i / sample_rate))
-            wf.writeframes(struct.pack("<h", value))
-    return buf.getvalue()
+def _post(path: str, **kwargs) -> httpx.Response:
+    return _CLIENT.post(path, **kwargs)
 
 
 # ── Session-scoped capability fixtures ────────────────────────────────────────
@@ -59,14 +66,85 @@ def _make_wav(duration_s: int = 1, frequency: float = 440.0, sample_rate: int =
 # This prevents Whisper model load from blocking test collection.
 
 
+# The slow session probes are fired by server_up on one background event loop,
+# so tests that need none of them run meanwhile. /system_self_test (may load
+# the Whisper model — minutes on first call) and /voice_self_test run together;
+# /process_text is only sent once /system_self_test has returned, so the LLM
+# call never competes with the Whisper load. Each fixture joins the warm-up
+# thread only when first requested.
+_SYSTEM_TIMEOUT = 180   # first call may load the Whisper model
+_VOICE_TIMEOUT = 10
+_TEXT_TIMEOUT = 60      # LLM may be slow
+_PREFETCH_TIMEOUT = _SYSTEM_TIMEOUT + _TEXT_TIMEOUT
+# key -> response JSON, or a description of why the probe failed
+_prefetched: dict[str, dict | str] = {}
+_prefetch_thread: threading.Thread | None = None
+
+
+async def _prefetch_one(client: httpx.AsyncClient, key: str, method: str, path: str, timeout: float, **kwargs) -> None:
+    try:
+        r = await client.request(method, path, timeout=timeout, **kwargs)
+    except Exception as exc:  # noqa: BLE001
+        _prefetched[key] = f"{method} {path} raised {exc!r}"
+        return
+    if r.status_code != 200:
+        _prefetched[key] = f"{method} {path} returned {r.status_code}: {r.text[:200]}"
+        return
+    try:
+        _prefetched[key] = r.json()
+    except ValueError as exc:
+        _prefetched[key] = f"{method} {path} returned invalid JSON: {exc}"
+
+
+async def _prefetch_all() -> None:
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        async def system_then_text() -> None:
+            await _prefetch_one(client, "system_status", "GET", "/system_self_test", _SYSTEM_TIMEOUT)
+            await _prefetch_one(client, "process_text", "POST", "/process_text", _TEXT_TIMEOUT, json={"text": _TANGLISH})
+
+        await asyncio.gather(
+            system_then_text(),
+            _prefetch_one(client, "voice_status", "GET", "/voice_self_test", _VOICE_TIMEOUT),
+        )
+
+
+def _prefetched_result(key: str) -> dict:
+    """Wait for the warm-up thread, then return the *key* probe's JSON.
+
+    A probe that errored, returned non-200 or never finished fails the
+    requesting test with the reason rather than masquerading as an empty body.
+    """
+    if _prefetch_thread is None:
+        return {}
+    _prefetch_thread.join(timeout=_PREFETCH_TIMEOUT)
+    result = _prefetched.get(key)
+    if result is None:
+        pytest.fail(f"{key} probe did not complete within {_PREFETCH_TIMEOUT}s")
+    if isinstance(result, str):
+        pytest.fail(result)
+    return dict(result)
+
+
 @pytest.fixture(scope="session")
 def server_up() -> bool:
-    """True if the Clara AI server answers /health."""
+    """True if the Clara AI server answers /health; starts the probe warm-up."""
+    global _prefetch_thread
+    # A refused TCP connect fails in well under a millisecond; only if the
+    # port is open is a full /health round trip needed to confirm the app
+    url = urlsplit(BASE_URL)
     try:
-        r = requests.get(f"{BASE_URL}/health", timeout=5)
-        return r.status_code == 200
-    except requests.exceptions.ConnectionError:
+        socket.create_connection((url.hostname, url.port or 80), timeout=0.2).close()
+    except OSError:
         return False
+    try:
+        r = _get("/health", timeout=5)
+    except httpx.TransportError:
+        return False
+    if r.status_code != 200:
+        return False
+    _prefetch_thread = threading.Thread(target=asyncio.run, args=(_prefetch_all(),), daemon=True)
+    _prefetch_thread.start()
+    return True
 
 
 @pytest.fixture(scope="session")
@@ -74,14 +152,7 @@ def system_status(server_up) -> dict:
     """Cached result of GET /system_self_test (runs Whisper check once)."""
     if not server_up:
         return {}
-    try:
-        # Allow extra time — first call may load the Whisper model
-        r = requests.get(f"{BASE_URL}/system_self_test", timeout=180)
-        if r.status_code == 200:
-            return r.json()
-    except Exception:  # noqa: BLE001
-        pass
-    return {}
+    return _prefetched_result("system_status")
 
 
 @pytest.fixture(scope="session")
@@ -89,31 +160,81 @@ def voice_status(server_up) -> dict:
     """Cached result of GET /voice_self_test."""
     if not server_up:
         return {}
-    try:
-        r = requests.get(f"{BASE_URL}/voice_self_test", timeout=10)
-        if r.status_code == 200:
-            return r.json()
-    except Exception:  # noqa: BLE001
-        pass
-    return {}
+    return _prefetched_result("voice_status")
+
+
+@pytest.fixture(scope="session")
+def sample_wav_bytes() -> bytes:
+    """1 s 440 Hz sine WAV, synthesised once and shared by every upload test."""
+    return make_wav_bytes()
 
 
 @pytest.fixture(scope="session")
 def process_text_response(system_status, server_up) -> dict:
-    """Cached result of POST /process_text (LLM may be slow — allow 60s)."""
+    """Cached result of POST /process_text (LLM may be slow — allow 60s).
+
+    Depends on system_status so /process_text is only sent once the Whisper
+    self-test has finished loading the model.
+    """
+    if not server_up:
+        return {}
+    return _prefetched_result("process_text")
+
+
+def _post_concurrently(payloads: dict[str, tuple[str, dict]]) -> dict[str, Future]:
+    """Fire every ``key: (path, json)`` POST at once; each test takes its ``.result()``."""
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        return {key: pool.submit(_post, path, json=body) for key, (path, body) in payloads.items()}
+
+
+@pytest.fixture(scope="session")
+def negative_process_text(server_up) -> dict[str, Future]:
+    """Both invalid /process_text requests, submitted together."""
     if not server_up:
         return {}
+    return _post_concurrently({
+        "empty": ("/process_text", {"text": ""}),
+        "missing": ("/process_text", {}),
+    })
+
+
+@pytest.fixture(scope="session")
+def negative_speak(voice_status, server_up) -> dict[str, Future]:
+    """Both invalid /speak requests, submitted together."""
+    if not server_up or voice_status.get("status") != "ready":
+        return {}
+    return _post_concurrently({
+        "unenrolled": ("/speak", {"text": _SPEAK_TEXT, "user_name": "__no_such_user_xyz__"}),
+        "empty_text": ("/speak", {"text": "", "user_name": _TEST_USER}),
+    })
+
+
+def _upload_sample(path: str, wav: bytes) -> tuple[int, dict]:
+    """POST *wav* to *path* once; return (status_code, JSON body or {})."""
     try:
-        r = requests.post(
-            f"{BASE_URL}/process_text",
-            json={"text": _TANGLISH},
-            timeout=60,
-        )
-        if r.status_code == 200:
-            return r.json()
+        r = _post(path, files={"file": ("sample.wav", wav, "audio/wav")})
     except Exception:  # noqa: BLE001
-        pass
-    return {}
+        return 0, {}
+    try:
+        return r.status_code, r.json()
+    except ValueError:
+        return r.status_code, {}
+
+
+@pytest.fixture(scope="session")
+def asr_response(system_status, server_up, sample_wav_bytes) -> tuple[int, dict]:
+    """Cached (status_code, body) of POST /asr with the sample WAV."""
+    if not server_up or not system_status.get("whisper_loaded"):
+        return 0, {}
+    return _upload_sample("/asr", sample_wav_bytes)
+
+
+@pytest.fixture(scope="session")
+def process_audio_response(system_status, server_up, sample_wav_bytes) -> tuple[int, dict]:
+    """Cached (status_code, body) of POST /process_audio with the sample WAV."""
+    if not server_up or not system_status.get("whisper_loaded"):
+        return 0, {}
+    return _upload_sample("/process_audio", sample_wav_bytes)
 
 
 # ── Tests ──────────────────────────────────────────────────────────────────────
@@ -272,56 +393,56 @@ def test_process_text_codeswitch_analysis(process_text_response, server_up):
     assert "language_mix" in cs, f"Missing codeswitch_analysis.language_mix: {cs}"
 
 
-def test_process_text_empty_input_rejected(server_up):
+def test_process_text_empty_input_rejected(server_up, negative_process_text):
     if not server_up:
         pytest.skip("Server not running")
-    r = _post("/process_text", json={"text": ""})
+    r = negative_process_text["empty"].result()
     assert r.status_code == 422, f"Empty text must return 422, got {r.status_code}"
 
 
-def test_process_text_missing_field_rejected(server_up):
+def test_process_text_missing_field_rejected(server_up, negative_process_text):
     if not server_up:
         pytest.skip("Server not running")
-    r = _post("/process_text", json={})
+    r = negative_process_text["missing"].result()
     assert r.status_code == 422, f"Missing 'text' must return 422, got {r.status_code}"
 
 
 # ── 5. ASR ─────────────────────────────────────────────────────────────────────
 
 
-def test_asr_returns_200(system_status, server_up):
+def test_asr_returns_200(system_status, server_up, asr_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    r = _post("/asr", files={"file": ("sample.wav", _make_wav(), "audio/wav")})
-    assert r.status_code == 200, f"Expected 200, got {r.status_code}: {r.text}"
+    status, body = asr_response
+    assert status == 200, f"Expected 200, got {status}: {body}"
 
 
-def test_asr_transcript_field(system_status, server_up):
+def test_asr_transcript_field(system_status, server_up, asr_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    body = _post("/asr", files={"file": ("sample.wav", _make_wav(), "audio/wav")}).json()
+    _, body = asr_response
     assert "transcript" in body, f"Missing 'transcript': {body}"
 
 
-def test_asr_language_field(system_status, server_up):
+def test_asr_language_field(system_status, server_up, asr_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    body = _post("/asr", files={"file": ("sample.wav", _make_wav(), "audio/wav")}).json()
+    _, body = asr_response
     assert body.get("language"), f"Missing or empty 'language': {body}"
 
 
-def test_asr_duration_is_numeric(system_status, server_up):
+def test_asr_duration_is_numeric(system_status, server_up, asr_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    body = _post("/asr", files={"file": ("sample.wav", _make_wav(), "audio/wav")}).json()
+    _, body = asr_response
     assert isinstance(body.get("duration"), (int, float)), (
         f"'duration' must be numeric: {body.get('duration')!r}"
     )
@@ -339,39 +460,38 @@ def test_asr_empty_file_rejected(system_status, server_up):
 # ── 6. Process audio ─────────────────────────────────────────────────────────
 
 
-def test_process_audio_status(system_status, server_up):
+def test_process_audio_status(system_status, server_up, process_audio_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    r = _post("/process_audio", files={"file": ("sample.wav", _make_wav(), "audio/wav")})
-    assert r.status_code in (200, 422), (
-        f"Expected 200 or 422 (empty transcript), got {r.status_code}: {r.text}"
+    status, body = process_audio_response
+    assert status in (200, 422), (
+        f"Expected 200 or 422 (empty transcript), got {status}: {body}"
     )
 
 
-def test_process_audio_fields(system_status, server_up):
+def test_process_audio_fields(system_status, server_up, process_audio_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    r = _post("/process_audio", files={"file": ("sample.wav", _make_wav(), "audio/wav")})
-    if r.status_code == 422:
+    status, body = process_audio_response
+    if status == 422:
         pytest.skip("Whisper returned empty transcript for synthetic tone audio")
-    body = r.json()
     for field in ("transcript", "intent", "report_text", "codeswitch_analysis"):
         assert field in body, f"Missing '{field}': {body}"
 
 
-def test_process_audio_confidence_float(system_status, server_up):
+def test_process_audio_confidence_float(system_status, server_up, process_audio_response):
     if not server_up:
         pytest.skip("Server not running")
     if not system_status.get("whisper_loaded"):
         pytest.skip("Whisper model not loaded on server")
-    r = _post("/process_audio", files={"file": ("sample.wav", _make_wav(), "audio/wav")})
-    if r.status_code == 422:
+    status, body = process_audio_response
+    if status == 422:
         pytest.skip("Empty transcript from synthetic audio")
-    conf = r.json()["intent"]["confidence_score"]
+    conf = body["intent"]["confidence_score"]
     assert isinstance(conf, float), f"confidence_score must be float, got {type(conf).__name__}"
 
 
@@ -386,18 +506,20 @@ def test_process_audio_empty_file_rejected(system_status, server_up):
 
 # ── 7. Enroll & Speak ─────────────────────────────────────────────────────────
 
-_TEST_USER = "__clara_integration_test_user__"
+# One enrolled user per xdist worker, so parallel workers never race on the
+# same /enroll_voice registration
+_TEST_USER = f"__clara_integration_test_user_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}__"
 _SPEAK_TEXT = "Motor pump has noise. Please inspect the capacitor immediately."
 
 
-def test_enroll_voice(voice_status, server_up):
+def test_enroll_voice(voice_status, server_up, sample_wav_bytes):
     if not server_up:
         pytest.skip("Server not running")
     if voice_status.get("status") != "ready":
         pytest.skip("ElevenLabs not configured")
     r = _post(
         "/enroll_voice",
-        files={"file": ("sample.wav", _make_wav(), "audio/wav")},
+        files={"file": ("sample.wav", sample_wav_bytes, "audio/wav")},
         data={"user_name": _TEST_USER},
     )
     assert r.status_code in (200, 502), (
@@ -405,14 +527,14 @@ def test_enroll_voice(voice_status, server_up):
     )
 
 
-def test_enroll_voice_response_shape(voice_status, server_up):
+def test_enroll_voice_response_shape(voice_status, server_up, sample_wav_bytes):
     if not server_up:
         pytest.skip("Server not running")
     if voice_status.get("status") != "ready":
         pytest.skip("ElevenLabs not configured")
     r = _post(
         "/enroll_voice",
-        files={"file": ("sample.wav", _make_wav(), "audio/wav")},
+        files={"file": ("sample.wav", sample_wav_bytes, "audio/wav")},
         data={"user_name": _TEST_USER},
     )
     if r.status_code != 200:
@@ -423,7 +545,7 @@ def test_enroll_voice_response_shape(voice_status, server_up):
     assert body.get("voice_id"), f"voice_id must be non-empty: {body}"
 
 
-def test_speak_audio_mpeg(voice_status, server_up):
+def test_speak_audio_mpeg(voice_status, server_up, sample_wav_bytes):
     if not server_up:
         pytest.skip("Server not running")
     if voice_status.get("status") != "ready":
@@ -431,7 +553,7 @@ def test_speak_audio_mpeg(voice_status, server_up):
     # Enroll first
     enroll = _post(
         "/enroll_voice",
-        files={"file": ("sample.wav", _make_wav(), "audio/wav")},
+        files={"file": ("sample.wav", sample_wav_bytes, "audio/wav")},
         data={"user_name": _TEST_USER},
     )
     if enroll.status_code != 200:
@@ -444,21 +566,21 @@ def test_speak_audio_mpeg(voice_status, server_up):
     assert len(r.content) > 0, "speak response body must not be empty"
 
 
-def test_speak_unenrolled_user_returns_400(voice_status, server_up):
+def test_speak_unenrolled_user_returns_400(voice_status, server_up, negative_speak):
     if not server_up:
         pytest.skip("Server not running")
     if voice_status.get("status") != "ready":
         pytest.skip("ElevenLabs not configured")
-    r = _post("/speak", json={"text": _SPEAK_TEXT, "user_name": "__no_such_user_xyz__"})
+    r = negative_speak["unenrolled"].result()
     assert r.status_code == 400, (
         f"Unenrolled user must return 400, got {r.status_code}: {r.text}"
     )
 
 
-def test_speak_empty_text_returns_400(voice_status, server_up):
+def test_speak_empty_text_returns_400(voice_status, server_up, negative_speak):
     if not server_up:
         pytest.skip("Server not running")
     if voice_status.get("status") != "ready":
         pytest.skip("ElevenLabs not configured")
-    r = _post("/speak", json={"text": "", "user_name": _TEST_USER})
+    r = negative_speak["empty_text"].result()
     assert r.status_code == 400, f"Empty text must return 400, got {r.status_code}: {r.text}"
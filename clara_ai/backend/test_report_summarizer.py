@@ -0,0 +1,54 @@
+"""Unit tests for services/report_summarizer.py (no server or API keys needed).
+
+Run:
+    cd backend
+    pytest test_report_summarizer.py -v
+"""
+
+from __future__ import annotations
+
+import time
+
+from services import report_summarizer as rs
+
+
+# ── Provider race ─────────────────────────────────────────────────────────────
+
+def _stub_provider(name: str, delay_s: float):
+    def call(text: str) -> dict:
+        time.sleep(delay_s)
+        return {"summary": f"{name} summary of {text}", "provider": name, "model": "stub", "latency_ms": 0}
+    return call
+
+
+def test_slow_loser_does_not_delay_next_race():
+    """Back-to-back races keep the fast provider's latency while slow losers pile up."""
+    providers = (("groq", _stub_provider("groq", 0.05)), ("deepseek", _stub_provider("deepseek", 1.0)))
+    # More races than a provider pool has workers, so leftovers would saturate a shared pool
+    for i in range(rs._PROVIDER_POOL_WORKERS + 4):
+        t0 = time.monotonic()
+        result = rs._first_valid_result("test", providers, f"report {i}", rs._check_summary)
+        elapsed = time.monotonic() - t0
+        assert result is not None and result["provider"] == "groq"
+        assert elapsed < 0.5, f"race {i} took {elapsed:.2f}s"
+
+
+# ── Executive summary extraction ──────────────────────────────────────────────
+
+def test_executive_summary_fallback_crlf():
+    """The loose fallback reads CRLF reports the same as LF ones."""
+    crlf = "Intro\r\nExecutive Summary\r\n\r\nPump failed.\r\nCall L2.\r\n"
+    assert rs._extract_executive_summary(crlf) == "Pump failed. Call L2."
+    assert rs._extract_executive_summary(crlf.replace("\r\n", "\n")) == "Pump failed. Call L2."
+
+
+def test_executive_summary_fallback_stops_at_rule():
+    """Capture skips single-# headings and stops at a '---' rule."""
+    report = "Executive Summary\n# Note\nPump failed.\n---\nNot part of it.\n"
+    assert rs._extract_executive_summary(report) == "Pump failed."
+
+
+def test_executive_summary_strips_nested_emphasis():
+    """***x*** loses every marker (bold pass, then italic pass)."""
+    report = "## 1. Executive Summary\n***Critical***   pump  *failure*\n## 2. Details\n"
+    assert rs._extract_executive_summary(report) == "Critical pump failure"
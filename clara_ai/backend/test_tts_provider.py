@@ -0,0 +1,63 @@
+"""Unit tests for services/tts_provider.py (no server or API keys needed).
+
+Run:
+    cd backend
+    pytest test_tts_provider.py -v
+"""
+
+from __future__ import annotations
+
+import ctypes
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent
+
+
+def _libespeak_available() -> bool:
+    try:
+        ctypes.CDLL("libespeak-ng.so.1")
+    except OSError:
+        return False
+    return True
+
+
+# ── In-process espeak-ng ──────────────────────────────────────────────────────
+
+@pytest.mark.skipif(not _libespeak_available(), reason="libespeak-ng.so.1 not installed")
+def test_missing_espeak_data_falls_back_to_cli():
+    """libespeak-ng with no espeak-ng-data must not exit(1) the process; the CLI path is used."""
+    # Run in a child process: without espeakINITIALIZE_DONT_EXIT the library
+    # would terminate the interpreter. espeak_Initialize is handed a data path
+    # that does not exist.
+    script = textwrap.dedent(
+        """
+        import ctypes
+
+        _real_cdll = ctypes.CDLL
+
+        class _MissingDataLib:
+            def __init__(self, name, *args, **kwargs):
+                self._lib = _real_cdll(name, *args, **kwargs)
+
+            def __getattr__(self, attr):
+                return getattr(self._lib, attr)
+
+            def espeak_Initialize(self, output, buflength, path, options):
+                return self._lib.espeak_Initialize(output, buflength, b"/nonexistent/espeak-ng-data", options)
+
+        ctypes.CDLL = _MissingDataLib
+
+        from services import tts_provider
+        print("in-process" if tts_provider._get_inprocess_espeak() is not None else "cli")
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "cli"
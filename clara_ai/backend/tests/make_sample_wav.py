@@ -7,11 +7,21 @@ Run once before executing the integration tests:
 
 from __future__ import annotations
 
+import array
 import math
 import struct
-import wave
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+# NumPy vectorises the sine; without it the stdlib array module is the fallback.
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
 OUTPUT = Path(__file__).parent / "sample.wav"
 
 SAMPLE_RATE = 16_000
@@ -19,16 +29,45 @@ DURATION_S = 1
 FREQUENCY = 440.0
 
 
+def _sine_pcm(n: int, frequency: float, sample_rate: int) -> bytes:
+    """Return *n* samples of a full-scale sine as little-endian 16-bit PCM."""
+    # An integer frequency repeats exactly every sample_rate / gcd samples:
+    # evaluate sin over one period and tile it
+    period = sample_rate // math.gcd(sample_rate, int(frequency)) if float(frequency).is_integer() else n
+    m = min(period, n)
+    reps = -(-n // m) if m else 0
+    if _NUMPY_AVAILABLE:
+        t = np.arange(m) / sample_rate
+        one = (32_767 * np.sin(2 * np.pi * frequency * t)).astype("<i2")
+        return np.tile(one, reps)[:n].tobytes()
+    # array stores the samples as one contiguous C buffer of shorts
+    one = array.array("h", (int(32_767 * math.sin(2 * math.pi * frequency * i / sample_rate)) for i in range(m)))
+    samples = (one * reps)[:n]
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+@lru_cache(maxsize=4)
+def make_wav_bytes(
+    duration_s: int = DURATION_S, frequency: float = FREQUENCY, sample_rate: int = SAMPLE_RATE
+) -> bytes:
+    """Return WAV bytes for a sine wave (16-bit mono); memoised per parameter set."""
+    data = _sine_pcm(sample_rate * duration_s, frequency, sample_rate)
+    # Canonical 44-byte PCM header: RIFF, "fmt " (format 1, mono, rate,
+    # byte rate, block align, 16 bits), "data" size
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(data),
+    )
+    return header + data
+
+
 def main() -> None:
-    n = SAMPLE_RATE * DURATION_S
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(OUTPUT), "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(SAMPLE_RATE)
-        for i in range(n):
-            value = int(32_767 * math.sin(2 * math.pi * FREQUENCY * i / SAMPLE_RATE))
-            wf.writeframes(struct.pack("<h", value))
+    OUTPUT.write_bytes(make_wav_bytes())
     print(f"Written: {OUTPUT}  ({OUTPUT.stat().st_size} bytes)")
 
 